@@ -0,0 +1,150 @@
+"""
+Aggregation Module
+==================
+Constant-memory running statistics over sentiment results.
+
+The aggregator keeps counts, a running mean/variance (Chan et al.'s
+parallel update of Welford's algorithm) and a fixed-resolution histogram of
+compound scores, so percentiles can be reported for any number of results
+without storing them.
+"""
+
+from typing import Dict, Iterable, List, Sequence
+import math
+import numpy as np
+
+
+# Percentiles reported in summaries
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95, 99)
+
+
+class SentimentAggregator:
+    """
+    Running statistics over compound scores and sentiment labels
+
+    Compound scores lie in [-1, 1]; they are bucketed into ``bins`` equal
+    width buckets, so percentiles are accurate to ``2 / bins``.
+    """
+
+    def __init__(self, bins: int = 2000):
+        """
+        Args:
+            bins (int): Histogram resolution over the compound range [-1, 1]
+        """
+        self.bins = bins
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sentiment_counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+
+    def add(self, result: Dict) -> None:
+        """Add a single analyze()-style result"""
+        self.add_many([result])
+
+    def add_many(self, results: Iterable[Dict]) -> None:
+        """Add analyze()-style results"""
+        compounds = []
+        for result in results:
+            compounds.append(result['scores']['compound'])
+            self.sentiment_counts[result['sentiment']] += 1
+        self._add_compounds(compounds)
+
+    def add_scores(self, compounds: Sequence[float], sentiments: Sequence[str]) -> None:
+        """Add parallel sequences of compound scores and sentiment labels"""
+        for sentiment in sentiments:
+            self.sentiment_counts[sentiment] += 1
+        self._add_compounds(compounds)
+
+    def merge(self, other: 'SentimentAggregator') -> None:
+        """Fold another aggregator with the same resolution into this one"""
+        if other.count == 0:
+            return
+        self._combine(other.count, other.mean, other._m2, other.min, other.max)
+        self.counts += other.counts
+        for sentiment, count in other.sentiment_counts.items():
+            self.sentiment_counts[sentiment] += count
+
+    def _add_compounds(self, compounds: Sequence[float]) -> None:
+        values = np.asarray(compounds, dtype=np.float64)
+        if values.size == 0:
+            return
+
+        batch_mean = float(values.mean())
+        batch_m2 = float(((values - batch_mean) ** 2).sum())
+        self._combine(values.size, batch_mean, batch_m2, float(values.min()), float(values.max()))
+
+        buckets = ((values + 1.0) / 2.0 * self.bins).astype(np.int64)
+        np.clip(buckets, 0, self.bins - 1, out=buckets)
+        self.counts += np.bincount(buckets, minlength=self.bins)
+
+    def _combine(self, n: int, mean: float, m2: float, low: float, high: float) -> None:
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self._m2 += m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+
+    @property
+    def stddev(self) -> float:
+        """Population standard deviation of compound scores"""
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate percentile of compound scores
+
+        Args:
+            q (float): Percentile in [0, 100]
+
+        Returns:
+            float: Midpoint of the histogram bucket holding the percentile
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(q / 100.0 * self.count))
+        bucket = int(np.searchsorted(np.cumsum(self.counts), rank))
+        value = (bucket + 0.5) / self.bins * 2.0 - 1.0
+        return min(max(value, self.min), self.max)
+
+    def histogram(self, bins: int = 20) -> List[Dict]:
+        """
+        Coarse histogram of compound scores
+
+        Args:
+            bins (int): Number of output buckets; must divide the resolution
+
+        Returns:
+            List of {'start', 'end', 'count'} buckets covering [-1, 1]
+        """
+        if self.bins % bins:
+            raise ValueError(f'bins must divide {self.bins}')
+        grouped = self.counts.reshape(bins, -1).sum(axis=1)
+        width = 2.0 / bins
+        return [
+            {
+                'start': round(-1.0 + i * width, 4),
+                'end': round(-1.0 + (i + 1) * width, 4),
+                'count': int(count)
+            }
+            for i, count in enumerate(grouped)
+        ]
+
+    def summary(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
+        """Return counts and compound score statistics"""
+        return {
+            'total_texts': self.count,
+            'positive_count': self.sentiment_counts['positive'],
+            'negative_count': self.sentiment_counts['negative'],
+            'neutral_count': self.sentiment_counts['neutral'],
+            'average_compound_score': round(self.mean, 4),
+            'median_compound_score': round(self.percentile(50), 4),
+            'stddev_compound_score': round(self.stddev, 4),
+            'min_compound_score': round(self.min, 4) if self.min is not None else 0.0,
+            'max_compound_score': round(self.max, 4) if self.max is not None else 0.0,
+            'percentiles': {f'p{q:g}': round(self.percentile(q), 4) for q in percentiles}
+        }
@@ -6,28 +6,234 @@ Uses NLTK's VADER sentiment analyzer for accurate sentiment detection.
 
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Request, abort, render_template, request, jsonify, Response, stream_with_context, g
 from sentiment_analyzer import SentimentAnalyzer
+from result_cache import ResultCache
+from persistent_cache import PersistentCache
+from preprocessing import PREPROCESS_MODES
+from parallel import ParallelExecutor
+from resources import ensure_resources
+from jobs import JobQueue, QueueFullError
+from coalescer import RequestCoalescer
+from sessions import DEFAULT_WINDOW, SessionStore
+from aggregation import SentimentAggregator
+import metrics
+from streaming import (
+    MAX_RECORD_CHARS, SPLIT_MODES, close_after, iter_lines, iter_records, iter_segments,
+    stream_analysis, stream_batch
+)
+import io
 import os
+import time
 from werkzeug.utils import secure_filename
 
+
+class SentimentRequest(Request):
+    """Request whose body size limit depends on the endpoint"""
+    
+    @property
+    def max_content_length(self):
+        # Streaming endpoints read their body incrementally, so they accept
+        # far larger bodies than routes that parse the whole body at once
+        if self.endpoint in STREAM_ENDPOINTS:
+            return STREAM_MAX_CONTENT_LENGTH
+        return super().max_content_length
+
+
 # Initialize Flask application
 app = Flask(__name__)
+app.request_class = SentimentRequest
 
 # Configuration
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'txt'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+STREAM_MAX_CONTENT_LENGTH = 1024 * 1024 * 1024  # 1GB max for the streaming endpoints
+STREAM_ENDPOINTS = ('upload_file_stream', 'batch_analyze_stream')
+STREAM_CHUNK_SIZE = 500  # segments scored per NDJSON chunk
+BATCH_STREAM_CHUNK_SIZE = 50  # records scored at once by /api/batch/stream
+
+# Result cache configuration (set RESULT_CACHE_MAX_ENTRIES to 0 to disable)
+RESULT_CACHE_MAX_ENTRIES = 10000
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 64MB
+RESULT_CACHE_TTL = 3600  # seconds, None to keep entries until evicted
+RESULT_CACHE_IGNORE_CASE = False  # True merges differently-cased duplicates
+
+# Optional SQLite score cache shared by worker processes and kept across
+# restarts; invalidated automatically when the lexicon or thresholds change
+PERSISTENT_CACHE_PATH = None  # e.g. 'scores.db'
+PERSISTENT_CACHE_MAX_ENTRIES = 1000000
+PERSISTENT_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+
+# Asynchronous job queue configuration
+JOB_WORKERS = 2  # background threads running jobs
+JOB_CHUNK_SIZE = 1000  # texts scored per progress update
+JOB_MAX_PENDING = 100  # queued jobs before submissions get 429
+JOB_MAX_RETAINED = 100  # finished jobs kept for result retrieval
+JOB_MAX_PAGE_SIZE = 1000  # largest results page returned by GET /api/jobs/<id>
+JOB_MAX_TEXTS = 100000  # texts per job; larger submissions get 413
+JOB_MAX_CHARS = 10 * 1024 * 1024  # total characters per job
+
+# Incremental analysis sessions (/api/sessions)
+SESSION_MAX_SESSIONS = 1000
+SESSION_TTL = 3600  # idle seconds before a session expires
+SESSION_MAX_WINDOW = 1000  # largest rolling window a client may request
+
+# Micro-batching of concurrent /api/analyze requests: texts arriving within
+# COALESCE_MAX_WAIT seconds are scored together (adds up to that much latency)
+COALESCE_ENABLED = False
+COALESCE_MAX_WAIT = 0.002
+COALESCE_MAX_BATCH = 64
+
+# Input limits per endpoint, in characters (BATCH_MAX_TEXTS counts texts)
+ANALYZE_MAX_CHARS = 1024 * 1024  # 1MB, scored in chunks above LONG_DOCUMENT_THRESHOLD
+UPLOAD_MAX_CHARS = 1024 * 1024
+UPLOAD_PREVIEW_CHARS = 300  # /api/upload returns previews, not the whole file
+KEYWORDS_MAX_CHARS = 5000
+SENTENCES_MAX_CHARS = 5000
+SESSION_MAX_APPEND_CHARS = 5000
+BATCH_MAX_TEXTS = 50
+
+# Texts longer than LONG_DOCUMENT_THRESHOLD characters are split at sentence
+# ends into chunks of at most LONG_DOCUMENT_CHUNK_CHARS, scored independently
+# (on the parallel workers when PARALLEL_WORKERS is set) and combined with a
+# length-weighted average
+LONG_DOCUMENT_THRESHOLD = 5000
+LONG_DOCUMENT_CHUNK_CHARS = 5000
+
+# Keyword extraction (/api/keywords and the /api/batch "keywords" option)
+KEYWORDS_DEFAULT_TOP_K = 10
+KEYWORDS_MAX_TOP_K = 50
+
+# Per-item fields selectable with the /api/batch "fields" option
+BATCH_FIELDS = ('text', 'sentiment', 'scores', 'processed_text', 'keywords')
+BATCH_HISTOGRAM_BINS = 20  # default histogram buckets for aggregate_only
+
+# Per-stage and per-endpoint timing exposed at /api/metrics
+METRICS_ENABLED = True
+
+# Optional lexicon/stopword snapshot from `python resources.py snapshot <path>`
+NLTK_SNAPSHOT = None
+
+# Optional memory-mapped lexicon from `python resources.py lexicon <path>`,
+# shared read-only by all worker processes
+LEXICON_PATH = None
+
+# Per-sentence VADER contribution cache (0 disables). Speeds up documents
+# with repeated sentences without changing their scores
+SENTENCE_CACHE_SIZE = 0
+
+# Parallel scoring configuration (set PARALLEL_WORKERS to 0 to score in-process)
+PARALLEL_WORKERS = 0  # e.g. os.cpu_count() on multi-core hosts
+PARALLEL_CHUNK_SIZE = 256  # texts per worker task
+# Smaller batches are scored in-process. This is above BATCH_MAX_TEXTS, so
+# /api/batch always scores in-process; the pool serves /api/jobs chunks
+# (JOB_CHUNK_SIZE) and long documents (see LONG_DOCUMENT_CHUNK_CHARS)
+PARALLEL_MIN_ITEMS = 512
+PARALLEL_PRELOAD = 'none'  # preprocess mode whose NLTK data workers load at start-up
 
 # Create upload folder if it doesn't exist
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+metrics.registry.enabled = METRICS_ENABLED
+# Body limit for every route except STREAM_ENDPOINTS (see SentimentRequest)
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 
 # Initialize sentiment analyzer
-sentiment_analyzer = SentimentAnalyzer()
+result_cache = ResultCache(
+    max_entries=RESULT_CACHE_MAX_ENTRIES,
+    max_bytes=RESULT_CACHE_MAX_BYTES,
+    ttl=RESULT_CACHE_TTL,
+    ignore_case=RESULT_CACHE_IGNORE_CASE
+) if RESULT_CACHE_MAX_ENTRIES > 0 else None
+analyzer_options = {
+    'snapshot': NLTK_SNAPSHOT,
+    'lexicon_path': LEXICON_PATH,
+    'sentence_cache_size': SENTENCE_CACHE_SIZE
+}
+parallel_executor = ParallelExecutor(
+    workers=PARALLEL_WORKERS,
+    chunk_size=PARALLEL_CHUNK_SIZE,
+    min_items=PARALLEL_MIN_ITEMS,
+    analyzer_options=analyzer_options,
+    preload=PARALLEL_PRELOAD
+) if PARALLEL_WORKERS > 0 else None
+persistent_cache = PersistentCache(
+    PERSISTENT_CACHE_PATH,
+    max_entries=PERSISTENT_CACHE_MAX_ENTRIES,
+    max_bytes=PERSISTENT_CACHE_MAX_BYTES
+) if PERSISTENT_CACHE_PATH else None
+sentiment_analyzer = SentimentAnalyzer(
+    cache=result_cache,
+    executor=parallel_executor,
+    persistent_cache=persistent_cache,
+    **analyzer_options
+)
+job_queue = JobQueue(
+    sentiment_analyzer,
+    workers=JOB_WORKERS,
+    chunk_size=JOB_CHUNK_SIZE,
+    max_pending=JOB_MAX_PENDING,
+    max_retained=JOB_MAX_RETAINED
+)
+request_coalescer = RequestCoalescer(
+    sentiment_analyzer,
+    max_wait=COALESCE_MAX_WAIT,
+    max_batch=COALESCE_MAX_BATCH
+) if COALESCE_ENABLED else None
+session_store = SessionStore(
+    sentiment_analyzer,
+    max_sessions=SESSION_MAX_SESSIONS,
+    ttl=SESSION_TTL
+)
+
+
+@app.before_request
+def start_request_timer():
+    """Record request start time for latency metrics"""
+    g.request_start = time.perf_counter()
+
+
+@app.before_request
+def enforce_body_limit():
+    """
+    Reject request bodies over the endpoint's size limit with 413
+    
+    Runs before the route, so the 413 is not swallowed by a route's error
+    handling. Bodies are not loaded into memory here: a declared
+    Content-Length is checked without reading, and chunked multipart uploads
+    are parsed the way the route would parse them, with file parts spooled
+    to disk. Only chunked non-multipart bodies, which the route reads whole
+    anyway, are read here (up to the limit) and cached for the route.
+    """
+    limit = request.max_content_length
+    if request.endpoint in STREAM_ENDPOINTS or limit is None:
+        return
+    if request.content_length is not None:
+        if request.content_length > limit:
+            abort(413)
+    elif request.mimetype.startswith('multipart/'):
+        # Raises 413 once the parser reads past the limit
+        request.files
+    elif len(request.get_data(cache=True)) >= limit:
+        # A chunked body is cut off at the limit rather than rejected
+        abort(413)
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Count the request and record its latency per endpoint"""
+    start = g.get('request_start')
+    if start is not None:
+        metrics.registry.observe_request(
+            request.endpoint or 'unmatched',
+            request.method,
+            response.status_code,
+            time.perf_counter() - start
+        )
+    return response
 
 
 def allowed_file(filename):
@@ -35,10 +241,28 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def preview(text, max_chars=UPLOAD_PREVIEW_CHARS):
+    """Return text cut to max_chars, with '...' appended if it was longer"""
+    return text[:max_chars] + '...' if len(text) > max_chars else text
+
+
+def analyze_text(text, preprocess='full'):
+    """Analyze one text, in chunks if it is longer than LONG_DOCUMENT_THRESHOLD"""
+    if len(text) > LONG_DOCUMENT_THRESHOLD:
+        return sentiment_analyzer.analyze_long(text, preprocess=preprocess, chunk_chars=LONG_DOCUMENT_CHUNK_CHARS)
+    if request_coalescer is not None:
+        return request_coalescer.analyze(text, preprocess=preprocess)
+    return sentiment_analyzer.analyze(text, preprocess=preprocess)
+
+
 @app.route('/')
 def index():
     """Render the main page"""
-    return render_template('index.html')
+    return render_template(
+        'index.html',
+        max_characters=ANALYZE_MAX_CHARS,
+        max_batch_texts=BATCH_MAX_TEXTS
+    )
 
 
 @app.route('/api/analyze', methods=['POST'])
@@ -48,7 +272,8 @@ def analyze():
     
     Expected JSON:
     {
-        "text": "user text to analyze"
+        "text": "user text to analyze",
+        "preprocess": "none/light/full"  (optional, default "full")
     }
     
     Returns:
@@ -60,6 +285,7 @@ def analyze():
             "neutral": float,
             "compound": float
         },
+        "chunks": int  (only for texts longer than LONG_DOCUMENT_THRESHOLD),
         "success": bool,
         "message": str
     }
@@ -81,22 +307,33 @@ def analyze():
                 'message': 'Text cannot be empty'
             }), 400
         
-        if len(text) > 5000:
+        if len(text) > ANALYZE_MAX_CHARS:
+            return jsonify({
+                'success': False,
+                'message': f'Text is too long. Maximum {ANALYZE_MAX_CHARS} characters allowed'
+            }), 400
+        
+        preprocess = data.get('preprocess', 'full')
+        
+        if preprocess not in PREPROCESS_MODES:
             return jsonify({
                 'success': False,
-                'message': 'Text is too long. Maximum 5000 characters allowed'
+                'message': f"preprocess must be one of: {', '.join(PREPROCESS_MODES)}"
             }), 400
         
         # Analyze sentiment
-        result = sentiment_analyzer.analyze(text)
+        result = analyze_text(text, preprocess)
         
-        return jsonify({
+        response = {
             'success': True,
             'sentiment': result['sentiment'],
             'scores': result['scores'],
             'processed_text': result['processed_text'],
             'message': 'Analysis completed successfully'
-        }), 200
+        }
+        if 'chunks' in result:
+            response['chunks'] = result['chunks']
+        return jsonify(response), 200
     
     except Exception as e:
         return jsonify({
@@ -105,6 +342,146 @@ def analyze():
         }), 500
 
 
+@app.route('/api/keywords', methods=['POST'])
+def extract_keywords():
+    """
+    Extract the words that drive the sentiment of the provided text
+    
+    Expected JSON:
+    {
+        "text": "user text to analyze",
+        "top_k": int  (optional, default 10)
+    }
+    
+    Returns:
+    {
+        "success": bool,
+        "keywords": [
+            {"word": str, "weight": float, "count": int},
+            ...
+        ],
+        "message": str
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'text' not in data:
+            return jsonify({
+                'success': False,
+                'message': 'No text provided'
+            }), 400
+        
+        text = data['text'].strip()
+        
+        if not text:
+            return jsonify({
+                'success': False,
+                'message': 'Text cannot be empty'
+            }), 400
+        
+        if len(text) > KEYWORDS_MAX_CHARS:
+            return jsonify({
+                'success': False,
+                'message': f'Text is too long. Maximum {KEYWORDS_MAX_CHARS} characters allowed'
+            }), 400
+        
+        top_k = data.get('top_k', KEYWORDS_DEFAULT_TOP_K)
+        
+        if not _valid_top_k(top_k):
+            return jsonify({
+                'success': False,
+                'message': f'top_k must be an integer between 1 and {KEYWORDS_MAX_TOP_K}'
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'keywords': sentiment_analyzer.extract_keywords(text, top_k),
+            'message': 'Keyword extraction completed successfully'
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error during keyword extraction: {str(e)}'
+        }), 500
+
+
+def _valid_top_k(top_k) -> bool:
+    return isinstance(top_k, int) and not isinstance(top_k, bool) and 1 <= top_k <= KEYWORDS_MAX_TOP_K
+
+
+@app.route('/api/sentences', methods=['POST'])
+def analyze_sentences():
+    """
+    Analyze sentiment of each sentence in the provided text
+    
+    Expected JSON:
+    {
+        "text": "user text to analyze"
+    }
+    
+    Returns:
+    {
+        "success": bool,
+        "document": {"sentiment": str, "scores": dict, "confidence": float},
+        "sentences": [
+            {"index": int, "sentence": str, "sentiment": str, "scores": dict},
+            ...
+        ],
+        "summary": {
+            "total_texts": int,
+            "positive_count": int,
+            "negative_count": int,
+            "neutral_count": int,
+            "average_compound_score": float,
+            ...
+            "most_positive_sentence": int,
+            "most_negative_sentence": int
+        },
+        "message": str
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'text' not in data:
+            return jsonify({
+                'success': False,
+                'message': 'No text provided'
+            }), 400
+        
+        text = data['text'].strip()
+        
+        if not text:
+            return jsonify({
+                'success': False,
+                'message': 'Text cannot be empty'
+            }), 400
+        
+        if len(text) > SENTENCES_MAX_CHARS:
+            return jsonify({
+                'success': False,
+                'message': f'Text is too long. Maximum {SENTENCES_MAX_CHARS} characters allowed'
+            }), 400
+        
+        result = sentiment_analyzer.analyze_document(text)
+        
+        return jsonify({
+            'success': True,
+            'document': result['document'],
+            'sentences': result['sentences'],
+            'summary': result['summary'],
+            'message': 'Sentence analysis completed successfully'
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error during sentence analysis: {str(e)}'
+        }), 500
+
+
 @app.route('/api/upload', methods=['POST'])
 def upload_file():
     """
@@ -117,7 +494,9 @@ def upload_file():
         "success": bool,
         "sentiment": str,
         "scores": dict,
-        "text": str,
+        "text": str (preview of the file text),
+        "processed_text": str (preview),
+        "truncated": bool (true if either preview was cut),
         "message": str
     }
     """
@@ -151,24 +530,28 @@ def upload_file():
                 'message': 'File is empty'
             }), 400
         
-        if len(content) > 5000:
+        if len(content) > UPLOAD_MAX_CHARS:
             return jsonify({
                 'success': False,
-                'message': 'File content is too long. Maximum 5000 characters allowed'
+                'message': f'File content is too long. Maximum {UPLOAD_MAX_CHARS} characters allowed'
             }), 400
         
         # Analyze sentiment
-        result = sentiment_analyzer.analyze(content)
+        result = analyze_text(content)
         
-        return jsonify({
+        # The client already has the file, so only previews are echoed back
+        response = {
             'success': True,
             'sentiment': result['sentiment'],
             'scores': result['scores'],
-            'text': content[:200] + '...' if len(content) > 200 else content,
-            'full_text': content,
-            'processed_text': result['processed_text'],
+            'text': preview(content),
+            'processed_text': preview(result['processed_text']),
+            'truncated': max(len(content), len(result['processed_text'])) > UPLOAD_PREVIEW_CHARS,
             'message': 'File analyzed successfully'
-        }), 200
+        }
+        if 'chunks' in result:
+            response['chunks'] = result['chunks']
+        return jsonify(response), 200
     
     except Exception as e:
         return jsonify({
@@ -177,6 +560,76 @@ def upload_file():
         }), 500
 
 
+@app.route('/api/upload/stream', methods=['POST'])
+def upload_file_stream():
+    """
+    Stream-analyze a large uploaded file with bounded memory
+    
+    Expected: either multipart/form-data with a 'file' field, or a raw
+    text/plain request body (read directly from the socket without
+    spooling). Optional 'split' ("line" or "sentence", default "line") and
+    'chunk_size' are read from form fields or query parameters.
+    
+    Returns:
+    NDJSON (application/x-ndjson), one record per line:
+    {"type": "chunk", "chunk": int, "results": [{"index": int, "sentiment": str, "scores": dict}, ...]}
+    ...
+    {"type": "summary", "total_texts": int, "positive_count": int, ...,
+     "average_compound_score": float, "percentiles": dict, "chunks": int}
+    """
+    if request.mimetype == 'text/plain':
+        stream = request.stream
+    else:
+        if 'file' not in request.files:
+            return jsonify({
+                'success': False,
+                'message': 'No file part in the request'
+            }), 400
+        
+        file = request.files['file']
+        
+        if file.filename == '':
+            return jsonify({
+                'success': False,
+                'message': 'No file selected'
+            }), 400
+        
+        if not allowed_file(file.filename):
+            return jsonify({
+                'success': False,
+                'message': 'Only .txt files are allowed'
+            }), 400
+        
+        # Take ownership of the spooled upload: the request closes its files
+        # when the view returns, before the response has been streamed
+        stream = file.stream
+        file.stream = io.BytesIO()
+    
+    split = request.values.get('split', 'line')
+    
+    if split not in SPLIT_MODES:
+        return jsonify({
+            'success': False,
+            'message': f"split must be one of: {', '.join(SPLIT_MODES)}"
+        }), 400
+    
+    try:
+        chunk_size = int(request.values.get('chunk_size', STREAM_CHUNK_SIZE))
+    except ValueError:
+        chunk_size = 0
+    
+    if chunk_size <= 0:
+        return jsonify({
+            'success': False,
+            'message': 'chunk_size must be a positive integer'
+        }), 400
+    
+    segments = iter_segments(iter_lines(stream), split=split)
+    records = close_after(stream_analysis(sentiment_analyzer, segments, chunk_size), stream)
+    
+    return Response(stream_with_context(records), mimetype='application/x-ndjson')
+
+
 @app.route('/api/batch', methods=['POST'])
 def batch_analyze():
     """
@@ -184,7 +637,14 @@ def batch_analyze():
     
     Expected JSON:
     {
-        "texts": ["text1", "text2", ...]
+        "texts": ["text1", "text2", ...],
+        "preprocess": "none/light/full"  (optional, default "none"),
+        "keywords": bool  (optional, default false),
+        "top_k": int  (optional, keywords per text, default 10),
+        "fields": ["sentiment", "scores", ...]  (optional, per-item fields to return),
+        "aggregate_only": bool  (optional, default false),
+        "histogram_bins": int  (optional, with aggregate_only, default 20),
+        "dedup": bool  (optional, score near-duplicate texts once, default false)
     }
     
     Returns:
@@ -194,11 +654,24 @@ def batch_analyze():
             {
                 "text": str,
                 "sentiment": str,
-                "scores": dict
+                "scores": dict,
+                "processed_text": str  (only when preprocess is not "none"),
+                "keywords": list  (only when keywords is true)
             },
             ...
-        ]
+        ],
+        "count": int,
+        "average_compound_score": float
     }
+    
+    With aggregate_only, "results" is replaced by "summary" (counts,
+    mean/median/stddev/min/max and percentiles of the compound score) and
+    "histogram" (list of {"start", "end", "count"} buckets).
+    
+    With dedup, texts that are identical after normalization (case, URLs,
+    emails, special characters, whitespace) share the first one's scores,
+    and the response adds "dedup": {"total_texts", "unique_texts",
+    "dedup_ratio"}.
     """
     try:
         data = request.get_json()
@@ -217,34 +690,113 @@ def batch_analyze():
                 'message': 'Texts must be a list'
             }), 400
         
-        if len(texts) > 50:
+        if len(texts) > BATCH_MAX_TEXTS:
+            return jsonify({
+                'success': False,
+                'message': f'Maximum {BATCH_MAX_TEXTS} texts can be analyzed at once'
+            }), 400
+        
+        preprocess = data.get('preprocess', 'none')
+        
+        if preprocess not in PREPROCESS_MODES:
+            return jsonify({
+                'success': False,
+                'message': f"preprocess must be one of: {', '.join(PREPROCESS_MODES)}"
+            }), 400
+        
+        keywords = bool(data.get('keywords', False))
+        top_k = data.get('top_k', KEYWORDS_DEFAULT_TOP_K)
+        
+        if not _valid_top_k(top_k):
+            return jsonify({
+                'success': False,
+                'message': f'top_k must be an integer between 1 and {KEYWORDS_MAX_TOP_K}'
+            }), 400
+        
+        fields = data.get('fields')
+        
+        if isinstance(fields, str):
+            fields = [field.strip() for field in fields.split(',') if field.strip()]
+        
+        if fields is not None and (
+            not isinstance(fields, list) or not fields
+            or any(field not in BATCH_FIELDS for field in fields)
+        ):
+            return jsonify({
+                'success': False,
+                'message': f"fields must be a non-empty list of: {', '.join(BATCH_FIELDS)}"
+            }), 400
+        
+        if fields is None:
+            fields = ['text', 'sentiment', 'scores']
+            if preprocess != 'none':
+                fields.append('processed_text')
+            if keywords:
+                fields.append('keywords')
+        
+        aggregate_only = bool(data.get('aggregate_only', False))
+        histogram_bins = data.get('histogram_bins', BATCH_HISTOGRAM_BINS)
+        aggregator = SentimentAggregator()
+        
+        if aggregate_only and (
+            not isinstance(histogram_bins, int) or isinstance(histogram_bins, bool)
+            or histogram_bins <= 0 or aggregator.bins % histogram_bins
+        ):
             return jsonify({
                 'success': False,
-                'message': 'Maximum 50 texts can be analyzed at once'
+                'message': f'histogram_bins must be a positive divisor of {aggregator.bins}'
             }), 400
         
+        texts = [text.strip() for text in texts]
+        texts = [text for text in texts if text]
+        
+        # Keywords are ranked from the tokens scored for the batch itself
+        keywords_top_k = top_k if 'keywords' in fields and not aggregate_only else None
+        
+        dedup_stats = None
+        if data.get('dedup', False):
+            batch, dedup_stats = sentiment_analyzer.analyze_batch_dedup(
+                texts, preprocess=preprocess, top_k=keywords_top_k
+            )
+        elif keywords_top_k is not None:
+            batch = sentiment_analyzer.analyze_batch_keywords(texts, preprocess=preprocess, top_k=keywords_top_k)
+        else:
+            batch = sentiment_analyzer.analyze_batch(texts, preprocess=preprocess)
+        aggregator.add_many(batch)
+        
+        if aggregate_only:
+            response = {
+                'success': True,
+                'summary': aggregator.summary(),
+                'histogram': aggregator.histogram(histogram_bins),
+                'count': aggregator.count,
+                'average_compound_score': aggregator.mean
+            }
+            if dedup_stats is not None:
+                response['dedup'] = dedup_stats
+            return jsonify(response), 200
+        
         results = []
-        compound_scores = []
-        for text in texts:
-            text = text.strip()
-            if text:
-                result = sentiment_analyzer.analyze(text)
-                results.append({
-                    'text': text,
-                    'sentiment': result['sentiment'],
-                    'scores': result['scores']
-                })
-                compound_scores.append(result['scores']['compound'])
-        
-        # Calculate average compound score
-        avg_compound = sum(compound_scores) / len(compound_scores) if compound_scores else 0
+        for text, result in zip(texts, batch):
+            values = {
+                'text': text,
+                'sentiment': result['sentiment'],
+                'scores': result['scores'],
+                'processed_text': result['processed_text']
+            }
+            if 'keywords' in fields:
+                values['keywords'] = result['keywords']
+            results.append({field: values[field] for field in fields})
         
-        return jsonify({
+        response = {
             'success': True,
             'results': results,
             'count': len(results),
-            'average_compound_score': avg_compound
-        }), 200
+            'average_compound_score': aggregator.mean
+        }
+        if dedup_stats is not None:
+            response['dedup'] = dedup_stats
+        return jsonify(response), 200
     
     except Exception as e:
         return jsonify({
@@ -253,15 +805,362 @@ def batch_analyze():
         }), 500
 
 
+@app.route('/api/batch/stream', methods=['POST'])
+def batch_analyze_stream():
+    """
+    Analyze an NDJSON stream of texts, streaming one result line per text
+    
+    Expected: an application/x-ndjson request body with one record per
+    line, either a JSON string or {"text": str, "id": any}. The body is
+    read incrementally from the socket. Optional query parameters:
+    'preprocess' (default "none") and 'chunk_size' (records scored at once,
+    default 50).
+    
+    Returns:
+    NDJSON (application/x-ndjson), one record per input record, in order:
+    {"type": "result", "index": int, "id": any, "sentiment": str, "scores": dict}
+    {"type": "error", "index": int, "id": any, "message": str}
+    ...
+    {"type": "summary", "total_texts": int, "positive_count": int, ...,
+     "average_compound_score": float, "percentiles": dict, "errors": int}
+    """
+    preprocess = request.args.get('preprocess', 'none')
+    
+    if preprocess not in PREPROCESS_MODES:
+        return jsonify({
+            'success': False,
+            'message': f"preprocess must be one of: {', '.join(PREPROCESS_MODES)}"
+        }), 400
+    
+    try:
+        chunk_size = int(request.args.get('chunk_size', BATCH_STREAM_CHUNK_SIZE))
+    except ValueError:
+        chunk_size = 0
+    
+    if chunk_size <= 0:
+        return jsonify({
+            'success': False,
+            'message': 'chunk_size must be a positive integer'
+        }), 400
+    
+    records = iter_records(iter_lines(request.stream, max_chars=MAX_RECORD_CHARS + 1))
+    output = stream_batch(sentiment_analyzer, records, chunk_size=chunk_size, preprocess=preprocess)
+    
+    return Response(stream_with_context(output), mimetype='application/x-ndjson')
+
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """
+    Submit a bulk analysis job
+    
+    Expected JSON:
+    {
+        "texts": ["text1", "text2", ...],  (up to JOB_MAX_TEXTS texts and JOB_MAX_CHARS characters)
+        "preprocess": "none/light/full"  (optional, default "none")
+    }
+    
+    Returns (202):
+    {
+        "success": bool,
+        "job_id": str,
+        "status": "queued",
+        "total": int,
+        "message": str
+    }
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'texts' not in data:
+            return jsonify({
+                'success': False,
+                'message': 'No texts provided'
+            }), 400
+        
+        texts = data['texts']
+        
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            return jsonify({
+                'success': False,
+                'message': 'Texts must be a list of strings'
+            }), 400
+        
+        if len(texts) > JOB_MAX_TEXTS:
+            return jsonify({
+                'success': False,
+                'message': f'Maximum {JOB_MAX_TEXTS} texts can be submitted per job'
+            }), 413
+        
+        if sum(len(text) for text in texts) > JOB_MAX_CHARS:
+            return jsonify({
+                'success': False,
+                'message': f'Texts are too long. Maximum {JOB_MAX_CHARS} characters per job'
+            }), 413
+        
+        preprocess = data.get('preprocess', 'none')
+        
+        if preprocess not in PREPROCESS_MODES:
+            return jsonify({
+                'success': False,
+                'message': f"preprocess must be one of: {', '.join(PREPROCESS_MODES)}"
+            }), 400
+        
+        job = job_queue.submit(texts, preprocess=preprocess)
+        
+        return jsonify({
+            'success': True,
+            'job_id': job.id,
+            'status': job.status,
+            'total': job.total,
+            'message': 'Job queued'
+        }), 202, {'Location': f'/api/jobs/{job.id}'}
+    
+    except QueueFullError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 429
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error submitting job: {str(e)}'
+        }), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Poll a job's progress and page through its results
+    
+    Query parameters: offset (default 0), limit (default 100)
+    
+    Returns:
+    {
+        "success": bool,
+        "job_id": str,
+        "status": "queued/running/completed/failed/cancelled",
+        "total": int,
+        "processed": int,
+        "progress": float,
+        "results": [{"index": int, "sentiment": str, "scores": dict}, ...],
+        "next_offset": int or null,
+        "summary": dict  (once finished)
+    }
+    """
+    job = job_queue.get(job_id)
+    
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': 'Job not found'
+        }), 404
+    
+    offset = request.args.get('offset', 0, type=int)
+    limit = request.args.get('limit', 100, type=int)
+    
+    if offset < 0 or limit <= 0 or limit > JOB_MAX_PAGE_SIZE:
+        return jsonify({
+            'success': False,
+            'message': f'offset must be >= 0 and limit between 1 and {JOB_MAX_PAGE_SIZE}'
+        }), 400
+    
+    info = job.to_dict(offset=offset, limit=limit)
+    info['success'] = True
+    
+    return jsonify(info), 200
+
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def delete_job(job_id):
+    """Cancel a queued or running job, or discard a finished job's results"""
+    job = job_queue.cancel(job_id)
+    
+    if job is None:
+        return jsonify({
+            'success': False,
+            'message': 'Job not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'job_id': job.id,
+        'message': 'Job removed' if job.finished else 'Job cancellation requested'
+    }), 200
+
+
+@app.route('/api/sessions', methods=['POST'])
+def create_session():
+    """
+    Start an incremental analysis session for appended text
+    
+    Expected JSON (optional):
+    {
+        "window": int  (rolling window in sentences, default 20)
+    }
+    
+    Returns (201, with a Location header):
+    {
+        "success": bool,
+        "session_id": str,
+        "sentences": int,
+        "pending_text": str,
+        "summary": dict,
+        "rolling": {"window": int, "size": int, "average_compound_score": float,
+                    "trend": float, "sentiment": str or null}
+    }
+    """
+    data = request.get_json(silent=True) or {}
+    window = data.get('window', DEFAULT_WINDOW)
+    
+    if not isinstance(window, int) or isinstance(window, bool) or not 1 <= window <= SESSION_MAX_WINDOW:
+        return jsonify({
+            'success': False,
+            'message': f'window must be an integer between 1 and {SESSION_MAX_WINDOW}'
+        }), 400
+    
+    session = session_store.create(window=window)
+    response = jsonify({'success': True, **session.to_dict()})
+    response.status_code = 201
+    response.headers['Location'] = f'/api/sessions/{session.id}'
+    return response
+
+
+@app.route('/api/sessions/<session_id>/append', methods=['POST'])
+def append_to_session(session_id):
+    """
+    Append text to a session and score only its new sentences
+    
+    The last sentence is held back as pending_text until it is terminated
+    (by . ! ? or a newline), or until a request sets "flush".
+    
+    Expected JSON:
+    {
+        "text": "newly appended text",
+        "flush": bool  (optional, default false)
+    }
+    
+    Returns:
+    {
+        "success": bool,
+        "new_sentences": [
+            {"index": int, "sentence": str, "sentiment": str, "scores": dict},
+            ...
+        ],
+        "session_id": str,
+        ...running aggregates as returned by GET /api/sessions/<id>
+    }
+    """
+    session = session_store.get(session_id)
+    
+    if session is None:
+        return jsonify({
+            'success': False,
+            'message': 'Session not found'
+        }), 404
+    
+    try:
+        data = request.get_json()
+        
+        if not data or not isinstance(data.get('text'), str):
+            return jsonify({
+                'success': False,
+                'message': 'No text provided'
+            }), 400
+        
+        text = data['text']
+        
+        if len(text) > SESSION_MAX_APPEND_CHARS:
+            return jsonify({
+                'success': False,
+                'message': f'Text is too long. Maximum {SESSION_MAX_APPEND_CHARS} characters per append'
+            }), 400
+        
+        entries = session_store.append(session, text, flush=bool(data.get('flush', False)))
+        
+        return jsonify({
+            'success': True,
+            'new_sentences': entries,
+            **session.to_dict()
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': f'Error during session analysis: {str(e)}'
+        }), 500
+
+
+@app.route('/api/sessions/<session_id>', methods=['GET'])
+def get_session(session_id):
+    """Return a session's running aggregates"""
+    session = session_store.get(session_id)
+    
+    if session is None:
+        return jsonify({
+            'success': False,
+            'message': 'Session not found'
+        }), 404
+    
+    return jsonify({'success': True, **session.to_dict()}), 200
+
+
+@app.route('/api/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    """End a session and discard its state"""
+    session = session_store.delete(session_id)
+    
+    if session is None:
+        return jsonify({
+            'success': False,
+            'message': 'Session not found'
+        }), 404
+    
+    return jsonify({'success': True, **session.to_dict()}), 200
+
+
 @app.route('/api/health', methods=['GET'])
 def health():
-    """Health check endpoint"""
+    """Health check endpoint, including cache, job queue and coalescer statistics"""
     return jsonify({
         'status': 'healthy',
-        'service': 'Sentiment Analysis API'
+        'service': 'Sentiment Analysis API',
+        'cache': result_cache.stats() if result_cache is not None else None,
+        'persistent_cache': persistent_cache.stats() if persistent_cache is not None else None,
+        'sentence_cache': (
+            sentiment_analyzer.sentence_cache.stats()
+            if sentiment_analyzer.sentence_cache is not None else None
+        ),
+        'jobs': job_queue.stats(),
+        'sessions': session_store.stats(),
+        'coalescer': request_coalescer.stats() if request_coalescer is not None else None
     }), 200
 
 
+@app.route('/api/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Expose stage latencies, request metrics and cache/job gauges in Prometheus text format"""
+    gauges = {}
+    
+    if result_cache is not None:
+        cache_stats = result_cache.stats()
+        for key in ('entries', 'bytes', 'hits', 'misses', 'evictions', 'expirations'):
+            gauges[f'sentiment_cache_{key}'] = cache_stats[key]
+    
+    gauges['sentiment_jobs_pending'] = job_queue.stats()['pending']
+    
+    if request_coalescer is not None:
+        coalescer_stats = request_coalescer.stats()
+        for key in ('batches', 'items', 'bypassed', 'pending'):
+            gauges[f'sentiment_coalescer_{key}'] = coalescer_stats[key]
+    
+    return Response(
+        metrics.registry.render_prometheus(gauges),
+        mimetype='text/plain; version=0.0.4'
+    )
+
+
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
@@ -271,6 +1170,15 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def request_too_large(error):
+    """Handle bodies over the endpoint's size limit"""
+    return jsonify({
+        'success': False,
+        'message': 'Request is too large. Use /api/upload/stream or /api/batch/stream for large inputs'
+    }), 413
+
+
 @app.errorhandler(500)
 def server_error(error):
     """Handle 500 errors"""
@@ -281,6 +1189,9 @@ def server_error(error):
 
 
 if __name__ == '__main__':
+    # Download any missing NLTK data (imports never touch the network)
+    ensure_resources(download=True)
+    
     # Run the Flask application
     # Use debug=True for development, debug=False for production
     app.run(debug=True, host='0.0.0.0', port=5001)
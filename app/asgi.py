@@ -0,0 +1,276 @@
+"""
+ASGI Serving Module
+===================
+Serves the Flask application from any ASGI server with bounded concurrency.
+
+Each HTTP request is handled by the unchanged Flask app (same endpoints and
+JSON contract) on a bounded thread pool, so CPU-bound scoring never blocks
+the event loop. At most ``max_workers`` requests run at once and at most
+``max_queue`` more wait for a worker. Further requests are shed immediately
+with 429, and queued requests that waited longer than ``queue_timeout`` are
+shed when they reach a worker instead of being served late.
+
+Request bodies are read from the ASGI receive channel as the app consumes
+them, and response bodies are sent as the app yields them, so the streaming
+endpoints keep their bounded memory use.
+
+Usage (from the app/ directory, with an ASGI server installed):
+    uvicorn asgi:application --host 0.0.0.0 --port 5001
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import io
+import json
+import sys
+import time
+
+
+# Requests processed concurrently
+ASGI_WORKERS = 8
+
+# Requests allowed to wait for a worker before new ones get 429
+ASGI_MAX_QUEUE = 64
+
+# Seconds a request may wait for a worker before it is shed (None to wait)
+ASGI_QUEUE_TIMEOUT = 2.0
+
+BUSY_BODY = json.dumps({
+    'success': False,
+    'message': 'Server is busy, try again later'
+}).encode('utf-8')
+
+
+class _ReceiveStream(io.RawIOBase):
+    """Blocking file-like view of the ASGI receive channel for wsgi.input"""
+
+    def __init__(self, receive, loop: asyncio.AbstractEventLoop):
+        self._receive = receive
+        self._loop = loop
+        self._buffer = b''
+        self._more_body = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer and self._more_body:
+            message = asyncio.run_coroutine_threadsafe(self._receive(), self._loop).result()
+            if message['type'] == 'http.disconnect':
+                self._more_body = False
+                raise OSError('Client disconnected')
+            self._buffer = message.get('body', b'')
+            self._more_body = message.get('more_body', False)
+
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class AsgiBridge:
+    """
+    ASGI application running a WSGI app on a bounded thread pool
+
+    Admission and counters are handled on the event loop thread, so they
+    need no lock.
+    """
+
+    def __init__(
+        self,
+        wsgi_app,
+        max_workers: int = ASGI_WORKERS,
+        max_queue: int = ASGI_MAX_QUEUE,
+        queue_timeout: Optional[float] = ASGI_QUEUE_TIMEOUT
+    ):
+        """
+        Args:
+            wsgi_app: WSGI application (the Flask app)
+            max_workers (int): Requests processed concurrently
+            max_queue (int): Requests allowed to wait for a worker
+            queue_timeout (float): Longest wait for a worker before a
+                request is shed with 429; None waits indefinitely
+        """
+        self.wsgi_app = wsgi_app
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='asgi')
+        self.in_flight = 0
+        self.shed = 0
+        self.served = 0
+
+    async def __call__(self, scope: Dict, receive, send) -> None:
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            # Websockets are not part of the API
+            await send({'type': 'websocket.close'})
+            return
+
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.shed += 1
+            await self._send_busy(send)
+            return
+
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            served = await loop.run_in_executor(
+                self.executor, self._handle, scope, receive, send, loop, time.monotonic()
+            )
+        finally:
+            self.in_flight -= 1
+        if served:
+            self.served += 1
+        else:
+            self.shed += 1
+
+    def stats(self) -> Dict:
+        """Return admission counters"""
+        return {
+            'in_flight': self.in_flight,
+            'served': self.served,
+            'shed': self.shed,
+            'max_workers': self.max_workers,
+            'max_queue': self.max_queue
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await asyncio.get_running_loop().run_in_executor(None, self.shutdown)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    @staticmethod
+    async def _send_busy(send) -> None:
+        await send({
+            'type': 'http.response.start',
+            'status': 429,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(BUSY_BODY)).encode('latin-1')),
+                (b'retry-after', b'1')
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': BUSY_BODY})
+
+    def _handle(self, scope: Dict, receive, send, loop: asyncio.AbstractEventLoop, queued_at: float) -> bool:
+        """
+        Run one request through the WSGI app on a worker thread
+
+        Returns:
+            bool: False if the request waited too long and was shed
+        """
+
+        def send_sync(message: Dict) -> None:
+            asyncio.run_coroutine_threadsafe(send(message), loop).result()
+
+        if self.queue_timeout is not None and time.monotonic() - queued_at > self.queue_timeout:
+            asyncio.run_coroutine_threadsafe(self._send_busy(send), loop).result()
+            return False
+
+        response = {}
+
+        def start_response(status: str, headers: List[Tuple[str, str]], exc_info=None):
+            if exc_info and response.get('started'):
+                raise exc_info[1].with_traceback(exc_info[2])
+            response['status'] = int(status.split(' ', 1)[0])
+            response['headers'] = [
+                (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers
+            ]
+            return write
+
+        def write(data: bytes) -> None:
+            if not response.get('started'):
+                response['started'] = True
+                send_sync({
+                    'type': 'http.response.start',
+                    'status': response['status'],
+                    'headers': response['headers']
+                })
+            if data:
+                send_sync({'type': 'http.response.body', 'body': data, 'more_body': True})
+
+        environ = build_environ(scope, _ReceiveStream(receive, loop))
+        try:
+            body = self.wsgi_app(environ, start_response)
+            try:
+                for data in body:
+                    write(data)
+            finally:
+                if hasattr(body, 'close'):
+                    body.close()
+        except Exception:
+            if response.get('started'):
+                raise
+            response['status'] = 500
+            response['headers'] = [(b'content-type', b'text/plain')]
+            write(b'Internal Server Error')
+        else:
+            write(b'')
+        send_sync({'type': 'http.response.body', 'body': b'', 'more_body': False})
+        return True
+
+
+def build_environ(scope: Dict, body: io.RawIOBase) -> Dict:
+    """
+    Translate an ASGI HTTP scope into a WSGI environ
+
+    Args:
+        scope (Dict): ASGI HTTP connection scope
+        body (io.RawIOBase): Request body stream for wsgi.input
+
+    Returns:
+        Dict: PEP 3333 environ
+    """
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': str(client[0]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BufferedReader(body),
+        # The body ends when the ASGI channel says so, with or without a
+        # Content-Length header
+        'wsgi.input_terminated': True,
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+    for name, value in scope.get('headers', []):
+        name = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE' or name == 'CONTENT_LENGTH':
+            key = name
+        else:
+            key = f'HTTP_{name}'
+        environ[key] = f'{environ[key]},{value}' if key in environ else value
+    return environ
+
+
+def create_application(**kwargs) -> AsgiBridge:
+    """Wrap the Flask app from app.py in an AsgiBridge"""
+    from app import app
+
+    return AsgiBridge(app, **kwargs)
+
+
+application = create_application()
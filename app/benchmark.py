@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+===============
+Reproducible throughput/latency benchmarks for SentimentAnalyzer and the
+Flask API endpoints.
+
+Synthetic short/medium/long review corpora are generated deterministically
+from sample_movie_review.txt. Each benchmark reports ops/sec, p50/p95/p99
+latency and peak traced memory; results can be saved as JSON to compare
+releases.
+
+Usage:
+    python benchmark.py [--iterations 200] [--only analyze,api_batch] [--with-cache] [--output results.json]
+"""
+
+from typing import Callable, Dict, List, Tuple
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_FILE = os.path.join(APP_DIR, 'sample_movie_review.txt')
+
+# Number of sentences per synthetic text for each corpus size
+CORPUS_SIZES = {'short': 1, 'medium': 5, 'long': 25}
+CORPUS_TEXTS = 200
+SEED = 1234
+
+
+def build_corpora(seed: int = SEED) -> Dict[str, List[str]]:
+    """
+    Generate short, medium and long review corpora from the sample review
+
+    Sentences from the sample are shuffled and recombined, so corpora are
+    realistic but contain many distinct texts (keeping caches honest).
+    """
+    with open(SAMPLE_FILE, encoding='utf-8') as f:
+        text = f.read()
+    sentences = [s.strip() for s in re.split(r'(?<=[.!?])\s+', text) if s.strip()]
+    rng = random.Random(seed)
+
+    corpora = {}
+    for name, size in CORPUS_SIZES.items():
+        corpora[name] = [
+            ' '.join(rng.choice(sentences) for _ in range(size))[:5000]
+            for _ in range(CORPUS_TEXTS)
+        ]
+    return corpora
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_benchmark(name: str, func: Callable[[int], object], iterations: int, ops_per_call: int = 1) -> Dict:
+    """
+    Time func(i) for each iteration and measure peak memory separately
+
+    Args:
+        name (str): Benchmark name
+        func (Callable[[int], object]): Operation to time, given the iteration index
+        iterations (int): Number of timed calls
+        ops_per_call (int): Logical operations per call (e.g. texts per batch)
+
+    Returns:
+        Dict of throughput, latency percentiles (ms) and peak memory (KiB)
+    """
+    # Warm up lazily loaded resources and caches of compiled patterns
+    for i in range(min(5, iterations)):
+        func(i)
+
+    latencies = []
+    start = time.perf_counter()
+    for i in range(iterations):
+        t0 = time.perf_counter()
+        func(i)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    # Peak memory is measured in a separate, shorter pass since tracing
+    # distorts timings
+    tracemalloc.start()
+    for i in range(min(20, iterations)):
+        func(i)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+    result = {
+        'name': name,
+        'iterations': iterations,
+        'ops_per_sec': round(iterations * ops_per_call / elapsed, 2),
+        'mean_ms': round(statistics.mean(latencies) * 1000, 4),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 4),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 4),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 4),
+        'peak_memory_kib': round(peak / 1024, 1)
+    }
+    print(
+        f"{name:<32} {result['ops_per_sec']:>12.1f} ops/s  "
+        f"p50 {result['p50_ms']:>9.3f} ms  p95 {result['p95_ms']:>9.3f} ms  "
+        f"p99 {result['p99_ms']:>9.3f} ms  peak {result['peak_memory_kib']:>9.1f} KiB"
+    )
+    return result
+
+
+def analyzer_benchmarks(corpora: Dict[str, List[str]], with_cache: bool) -> Dict[str, Tuple[Callable, int]]:
+    """Benchmarks calling SentimentAnalyzer directly, as (func, ops_per_call)"""
+    from sentiment_analyzer import SentimentAnalyzer
+    from result_cache import ResultCache
+
+    analyzer = SentimentAnalyzer(cache=ResultCache() if with_cache else None)
+    benchmarks = {}
+
+    for size, texts in corpora.items():
+        n = len(texts)
+        benchmarks[f'analyze_{size}'] = (lambda i, t=texts, n=n: analyzer.analyze(t[i % n]), 1)
+        benchmarks[f'analyze_scores_only_{size}'] = (
+            lambda i, t=texts, n=n: analyzer.analyze(t[i % n], preprocess='none'), 1
+        )
+        benchmarks[f'preprocess_text_{size}'] = (lambda i, t=texts, n=n: analyzer.preprocess_text(t[i % n]), 1)
+        benchmarks[f'get_key_sentiments_{size}'] = (lambda i, t=texts, n=n: analyzer.get_key_sentiments(t[i % n]), 1)
+        benchmarks[f'analyze_batch_{size}'] = (lambda i, t=texts, n=n: analyzer.analyze_batch(t[:50]), 50)
+
+    return benchmarks
+
+
+def api_benchmarks(corpora: Dict[str, List[str]], with_cache: bool) -> Dict[str, Tuple[Callable, int]]:
+    """Benchmarks driving the Flask app through its test client, as (func, ops_per_call)"""
+    import app as app_module
+
+    if not with_cache:
+        app_module.sentiment_analyzer.cache = None
+    client = app_module.app.test_client()
+    benchmarks = {}
+
+    def check(response):
+        if response.status_code != 200:
+            raise RuntimeError(f'Unexpected status {response.status_code}: {response.get_data(as_text=True)[:200]}')
+
+    for size, texts in corpora.items():
+        n = len(texts)
+        benchmarks[f'api_analyze_{size}'] = (
+            lambda i, t=texts, n=n: check(client.post('/api/analyze', json={'text': t[i % n]})), 1
+        )
+        benchmarks[f'api_batch_{size}'] = (
+            lambda i, t=texts, n=n: check(client.post('/api/batch', json={'texts': t[:50]})), 50
+        )
+        benchmarks[f'api_upload_{size}'] = (
+            lambda i, t=texts, n=n: check(client.post(
+                '/api/upload',
+                data={'file': (io.BytesIO(t[i % n].encode('utf-8')), 'review.txt')},
+                content_type='multipart/form-data'
+            )), 1
+        )
+
+    return benchmarks
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Benchmark the sentiment analyzer and API')
+    parser.add_argument('--iterations', type=int, default=200, help='timed calls per benchmark')
+    parser.add_argument('--only', help='comma-separated benchmark name prefixes to run')
+    parser.add_argument('--with-cache', action='store_true', help='keep the result cache enabled')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    os.chdir(APP_DIR)
+    sys.path.insert(0, APP_DIR)
+
+    corpora = build_corpora()
+    benchmarks = analyzer_benchmarks(corpora, args.with_cache)
+    benchmarks.update(api_benchmarks(corpora, args.with_cache))
+
+    prefixes = args.only.split(',') if args.only else None
+    results = []
+    for name, (func, ops_per_call) in benchmarks.items():
+        if prefixes and not any(name.startswith(prefix) for prefix in prefixes):
+            continue
+        results.append(run_benchmark(name, func, args.iterations, ops_per_call))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': sys.version,
+                'platform': platform.platform(),
+                'iterations': args.iterations,
+                'with_cache': args.with_cache,
+                'corpus_texts': CORPUS_TEXTS,
+                'seed': SEED,
+                'results': results
+            }, f, indent=2)
+        print(f'Results written to {args.output}')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
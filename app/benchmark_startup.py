@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Startup Time Benchmark
+======================
+Measures cold-start cost of the analyzer in fresh interpreter processes:
+
+- import:     importing sentiment_analyzer
+- construct:  creating a SentimentAnalyzer
+- first_call: the first analyze() (where lazily loaded resources are read)
+- total:      wall-clock time of the whole child process
+
+Usage:
+    python benchmark_startup.py [--runs 5] [--snapshot nltk.pkl] [--max-seconds 2.0] [--output startup.json]
+
+With --max-seconds the script exits with status 1 if the median total
+exceeds the threshold, so it can guard against startup regressions.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHILD_SCRIPT = """
+import json, sys, time
+t0 = time.perf_counter()
+from sentiment_analyzer import SentimentAnalyzer
+t1 = time.perf_counter()
+analyzer = SentimentAnalyzer(snapshot=sys.argv[1] or None)
+t2 = time.perf_counter()
+analyzer.analyze('This is a surprisingly good movie!', preprocess=sys.argv[2])
+t3 = time.perf_counter()
+print(json.dumps({'import': t1 - t0, 'construct': t2 - t1, 'first_call': t3 - t2}))
+"""
+
+
+def run_once(snapshot: str, preprocess: str) -> dict:
+    """Run one cold start in a child interpreter and return its timings"""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD_SCRIPT, snapshot or '', preprocess],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings['total'] = time.perf_counter() - start
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Measure analyzer startup time')
+    parser.add_argument('--runs', type=int, default=5, help='number of cold starts')
+    parser.add_argument('--snapshot', help='resources.py snapshot to load')
+    parser.add_argument('--preprocess', default='full', choices=['none', 'light', 'full'])
+    parser.add_argument('--max-seconds', type=float, help='fail if the median total exceeds this')
+    parser.add_argument('--output', help='write results as JSON to this file')
+    args = parser.parse_args()
+
+    runs = [run_once(args.snapshot, args.preprocess) for _ in range(args.runs)]
+    medians = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+    for key, value in medians.items():
+        print(f'{key:>10}: {value * 1000:8.1f} ms (median of {args.runs})')
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'runs': runs,
+                'median': medians,
+                'snapshot': args.snapshot,
+                'preprocess': args.preprocess,
+                'python': sys.version
+            }, f, indent=2)
+
+    if args.max_seconds is not None and medians['total'] > args.max_seconds:
+        print(f"FAIL: median startup {medians['total']:.3f}s exceeds {args.max_seconds:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
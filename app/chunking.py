@@ -0,0 +1,90 @@
+"""
+Document Chunking Module
+========================
+Splits long documents into bounded chunks for independent scoring.
+
+VADER's cost grows with text length and its compound score saturates
+towards +/-1 on long texts, so long documents are cut into chunks of at
+most ``max_chars`` characters, each scored on its own and combined with a
+length-weighted average. Cuts are made at the last sentence end (or line
+break) inside the window, falling back to the last whitespace and, for
+unbroken runs of text, to a hard cut. Splitting is a single linear scan,
+so it stays cheap for megabyte-sized inputs.
+"""
+
+from typing import Dict, List, Sequence
+import re
+
+
+# Sentence-ending punctuation (with closing quotes/brackets) or a line break,
+# followed by whitespace
+_BOUNDARY_PATTERN = re.compile(r'[.!?]+["\')\]]*\s+|\n\s*')
+
+
+def split_chunks(text: str, max_chars: int) -> List[str]:
+    """
+    Split text into stripped, non-empty chunks of at most max_chars
+
+    Args:
+        text (str): Document text
+        max_chars (int): Largest chunk length, in characters
+
+    Returns:
+        List of chunks in document order
+    """
+    if max_chars <= 0:
+        raise ValueError('max_chars must be positive')
+
+    chunks = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = start + max_chars
+        cut = _last_boundary(text, start, end)
+        chunk = text[start:cut].strip()
+        if chunk:
+            chunks.append(chunk)
+        start = cut
+
+    tail = text[start:].strip()
+    if tail:
+        chunks.append(tail)
+    return chunks
+
+
+def _last_boundary(text: str, start: int, end: int) -> int:
+    """Return the cut position for the window text[start:end]"""
+    # Prefer boundaries in the second half of the window, so chunks are not
+    # much shorter than max_chars
+    floor = start + (end - start) // 2
+    cut = None
+    for match in _BOUNDARY_PATTERN.finditer(text, floor, end):
+        cut = match.end()
+    if cut is not None:
+        return cut
+
+    space = max(text.rfind(' ', floor, end), text.rfind('\n', floor, end))
+    if space > start:
+        return space + 1
+    return end
+
+
+def weighted_scores(results: Sequence[Dict], weights: Sequence[float]) -> Dict[str, float]:
+    """
+    Combine chunk results into weighted-average VADER polarity scores
+
+    Args:
+        results (Sequence[Dict]): analyze()-style results, one per chunk
+        weights (Sequence[float]): Weight of each chunk (e.g. its length)
+
+    Returns:
+        Dict with pos/neg/neu/compound keys, as VADER's polarity_scores()
+    """
+    total = float(sum(weights))
+    combined = {'pos': 0.0, 'neg': 0.0, 'neu': 0.0, 'compound': 0.0}
+    for result, weight in zip(results, weights):
+        scores = result['scores']
+        combined['pos'] += scores['positive'] * weight
+        combined['neg'] += scores['negative'] * weight
+        combined['neu'] += scores['neutral'] * weight
+        combined['compound'] += scores['compound'] * weight
+    return {key: value / total for key, value in combined.items()}
@@ -0,0 +1,130 @@
+"""
+Request Coalescer Module
+========================
+Micro-batching for concurrent single-text analysis requests.
+
+Each request thread submits its text and blocks on a future. A background
+thread gathers submissions for up to ``max_wait`` seconds (or until
+``max_batch`` texts are waiting), scores each preprocessing mode's texts
+with one SentimentAnalyzer.analyze_batch() call and resolves the futures.
+Under high concurrency the per-call overhead is paid once per batch; a
+lone request waits at most ``max_wait`` longer than it would unbatched.
+"""
+
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+import queue
+import threading
+import time
+
+
+# Default time window for gathering a batch, in seconds
+DEFAULT_MAX_WAIT = 0.002
+
+# Default largest batch scored at once
+DEFAULT_MAX_BATCH = 64
+
+
+class RequestCoalescer:
+    """
+    Gathers concurrent analyze() calls into batched analyze_batch() calls
+
+    Results are identical to calling ``analyzer.analyze()`` directly.
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_pending: int = 10000
+    ):
+        """
+        Args:
+            analyzer: SentimentAnalyzer used to score batches
+            max_wait (float): Longest time a batch stays open, in seconds
+            max_batch (int): Batch size that is scored without waiting further
+            max_pending (int): Queued texts beyond which callers are scored
+                directly instead of being queued
+        """
+        self.analyzer = analyzer
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._bypassed = 0
+        self._thread = threading.Thread(target=self._worker, name='sentiment-coalescer', daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str, preprocess: str = 'full') -> Future:
+        """
+        Queue a text for the next batch
+
+        Raises:
+            queue.Full: If max_pending texts are already waiting
+        """
+        future = Future()
+        self._queue.put_nowait((text, preprocess, future))
+        return future
+
+    def analyze(self, text: str, preprocess: str = 'full') -> Dict:
+        """
+        Analyze one text as part of a batch
+
+        Same contract as SentimentAnalyzer.analyze(); falls back to a direct
+        call when the queue is full.
+        """
+        try:
+            future = self.submit(text, preprocess)
+        except queue.Full:
+            with self._lock:
+                self._bypassed += 1
+            return self.analyzer.analyze(text, preprocess=preprocess)
+        return future.result()
+
+    def stats(self) -> Dict:
+        """Return batch counters"""
+        with self._lock:
+            return {
+                'batches': self._batches,
+                'items': self._items,
+                'average_batch_size': round(self._items / self._batches, 2) if self._batches else 0.0,
+                'bypassed': self._bypassed,
+                'pending': self._queue.qsize()
+            }
+
+    def _worker(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._score(batch)
+
+    def _score(self, batch: List[Tuple[str, str, Future]]) -> None:
+        groups: Dict[str, List[Tuple[str, Future]]] = {}
+        for text, preprocess, future in batch:
+            if future.set_running_or_notify_cancel():
+                groups.setdefault(preprocess, []).append((text, future))
+
+        for preprocess, items in groups.items():
+            try:
+                results = self.analyzer.analyze_batch([text for text, _ in items], preprocess=preprocess)
+            except Exception as e:
+                for _, future in items:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(items, results):
+                future.set_result(result)
+
+        with self._lock:
+            self._batches += 1
+            self._items += len(batch)
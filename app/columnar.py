@@ -0,0 +1,221 @@
+"""
+Columnar Results Module
+=======================
+Compact, column-oriented container for large batches of sentiment results.
+
+analyze() returns a nested dictionary per text, which costs several
+hundred bytes per result once the dicts, strings and floats are counted.
+BatchResult stores the same information in typed NumPy columns: float32
+scores and confidence, a uint8 sentiment code, and optionally all
+processed texts in one shared UTF-8 buffer addressed by offsets. That is
+21 bytes per result plus the processed text itself.
+
+Scores are the 4-decimal values analyze() reports, so converting back with
+to_dicts() or result() reproduces analyze()'s output exactly. Convert only
+at the edge (when serializing), and only the rows that are needed.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+import numpy as np
+
+
+# Sentiment label codes stored in the sentiment column
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
+
+SCORE_COLUMNS = ('positive', 'negative', 'neutral', 'compound')
+
+_LABEL_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+
+
+class BatchResult:
+    """
+    Sentiment results for a batch, one array element per text
+
+    Attributes:
+        positive, negative, neutral, compound, confidence (np.ndarray):
+            float32 score columns
+        sentiment (np.ndarray): uint8 codes into SENTIMENT_LABELS
+        text_buffer (bytes): UTF-8 processed texts, concatenated; None if
+            processed text was not kept
+        text_offsets (np.ndarray): int64 offsets of length len(self) + 1;
+            text i is text_buffer[text_offsets[i]:text_offsets[i + 1]]
+    """
+
+    def __init__(
+        self,
+        positive: np.ndarray,
+        negative: np.ndarray,
+        neutral: np.ndarray,
+        compound: np.ndarray,
+        confidence: np.ndarray,
+        sentiment: np.ndarray,
+        text_buffer: Optional[bytes] = None,
+        text_offsets: Optional[np.ndarray] = None
+    ):
+        self.positive = positive
+        self.negative = negative
+        self.neutral = neutral
+        self.compound = compound
+        self.confidence = confidence
+        self.sentiment = sentiment
+        self.text_buffer = text_buffer
+        self.text_offsets = text_offsets
+
+    @classmethod
+    def from_results(cls, results: Sequence[Dict], keep_text: bool = False) -> 'BatchResult':
+        """
+        Pack analyze()-style result dictionaries
+
+        Args:
+            results (Sequence[Dict]): Results as returned by analyze_batch()
+            keep_text (bool): Keep each result's processed_text
+
+        Returns:
+            BatchResult with the same rows, in order
+        """
+        columns = {
+            name: np.fromiter((result['scores'][name] for result in results), np.float32, len(results))
+            for name in SCORE_COLUMNS
+        }
+        columns['confidence'] = np.fromiter(
+            (result['confidence'] for result in results), np.float32, len(results)
+        )
+        columns['sentiment'] = np.fromiter(
+            (_LABEL_CODES[result['sentiment']] for result in results), np.uint8, len(results)
+        )
+
+        if keep_text:
+            encoded = [result['processed_text'].encode('utf-8') for result in results]
+            offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+            np.cumsum([len(text) for text in encoded], out=offsets[1:])
+            columns['text_buffer'] = b''.join(encoded)
+            columns['text_offsets'] = offsets
+        return cls(**columns)
+
+    @classmethod
+    def concatenate(cls, parts: Iterable['BatchResult']) -> 'BatchResult':
+        """
+        Join BatchResults end to end
+
+        Processed text is kept only if every part has it.
+        """
+        parts = list(parts)
+        if not parts:
+            return cls.from_results([])
+
+        columns = {
+            name: np.concatenate([getattr(part, name) for part in parts])
+            for name in SCORE_COLUMNS + ('confidence', 'sentiment')
+        }
+        if all(part.text_buffer is not None for part in parts):
+            offsets = [np.zeros(1, dtype=np.int64)]
+            base = 0
+            for part in parts:
+                offsets.append(part.text_offsets[1:] + base)
+                base += len(part.text_buffer)
+            columns['text_buffer'] = b''.join(part.text_buffer for part in parts)
+            columns['text_offsets'] = np.concatenate(offsets)
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.compound)
+
+    @property
+    def has_text(self) -> bool:
+        return self.text_buffer is not None
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the columns and text buffer"""
+        size = sum(getattr(self, name).nbytes for name in SCORE_COLUMNS + ('confidence', 'sentiment'))
+        if self.has_text:
+            size += len(self.text_buffer) + self.text_offsets.nbytes
+        return size
+
+    def labels(self) -> List[str]:
+        """Sentiment label of every row"""
+        return [SENTIMENT_LABELS[code] for code in self.sentiment.tolist()]
+
+    def processed_text(self, i: int) -> str:
+        """Processed text of row i ('' if processed text was not kept)"""
+        if not self.has_text:
+            return ''
+        return self.text_buffer[self.text_offsets[i]:self.text_offsets[i + 1]].decode('utf-8')
+
+    def result(self, i: int) -> Dict:
+        """Row i as an analyze()-style result dictionary"""
+        return self._row(
+            i, SENTIMENT_LABELS[self.sentiment[i]],
+            float(self.positive[i]), float(self.negative[i]), float(self.neutral[i]),
+            float(self.compound[i]), float(self.confidence[i])
+        )
+
+    def iter_dicts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Yield rows start..stop as analyze()-style result dictionaries
+
+        Columns are converted to Python floats one slice at a time, so
+        paging through a large result set stays cheap.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        rows = zip(
+            range(start, stop),
+            self.sentiment[start:stop].tolist(),
+            self.positive[start:stop].tolist(),
+            self.negative[start:stop].tolist(),
+            self.neutral[start:stop].tolist(),
+            self.compound[start:stop].tolist(),
+            self.confidence[start:stop].tolist()
+        )
+        for i, code, positive, negative, neutral, compound, confidence in rows:
+            yield self._row(i, SENTIMENT_LABELS[code], positive, negative, neutral, compound, confidence)
+
+    def to_dicts(self) -> List[Dict]:
+        """All rows as analyze()-style result dictionaries"""
+        return list(self.iter_dicts())
+
+    def to_columns(self) -> Dict[str, List]:
+        """
+        JSON-ready column lists
+
+        Returns:
+            Dict with 'sentiment' labels, rounded score and confidence lists,
+            and 'processed_text' when processed text was kept
+        """
+        columns = {'sentiment': self.labels()}
+        for name in SCORE_COLUMNS + ('confidence',):
+            columns[name] = [round(value, 4) for value in getattr(self, name).tolist()]
+        if self.has_text:
+            columns['processed_text'] = [self.processed_text(i) for i in range(len(self))]
+        return columns
+
+    def summary(self) -> Dict:
+        """Average compound score and label counts, as compare_sentiments() reports them"""
+        counts = np.bincount(self.sentiment, minlength=len(SENTIMENT_LABELS))
+        compounds = np.round(self.compound.astype(np.float64), 4)
+        average = float(compounds.sum()) / len(self) if len(self) else 0
+        return {
+            'average_compound_score': round(average, 4),
+            'total_texts': len(self),
+            'positive_count': int(counts[_LABEL_CODES['positive']]),
+            'negative_count': int(counts[_LABEL_CODES['negative']]),
+            'neutral_count': int(counts[_LABEL_CODES['neutral']])
+        }
+
+    def _row(
+        self, i: int, sentiment: str, positive: float, negative: float,
+        neutral: float, compound: float, confidence: float
+    ) -> Dict:
+        # float32 keeps about 7 significant digits, so rounding to the 4
+        # decimals analyze() reports recovers the original values exactly
+        return {
+            'sentiment': sentiment,
+            'scores': {
+                'positive': round(positive, 4),
+                'negative': round(negative, 4),
+                'neutral': round(neutral, 4),
+                'compound': round(compound, 4)
+            },
+            'processed_text': self.processed_text(i),
+            'confidence': round(confidence, 4)
+        }
@@ -0,0 +1,90 @@
+"""
+Batch Deduplication Module
+==========================
+Near-duplicate pre-pass for batch inputs.
+
+Texts are canonicalized with the preprocessing TextNormalizer (lowercase,
+URLs, emails and special characters removed, whitespace collapsed) and
+grouped by a hash of the canonical form. Only the first text of each group
+is scored; its result is fanned back out to every position in the group.
+Retweets, template messages and copy-pasted reviews that differ only in
+case, links or punctuation noise are then scored once.
+
+The grouping is approximate: VADER is case-sensitive (ALL CAPS emphasis)
+and the normalizer drops emoticons, so texts that differ only in those
+features can score differently. Use it where that trade-off is acceptable.
+"""
+
+from typing import List, NamedTuple, Optional
+import hashlib
+from preprocessing import TextNormalizer
+
+
+class DedupPlan(NamedTuple):
+    """
+    Grouping of a batch by canonical text
+
+    Attributes:
+        representatives (List[int]): Index of the first text of each group
+        groups (List[int]): For each input text, the index of its group in
+            representatives
+    """
+    representatives: List[int]
+    groups: List[int]
+
+    @property
+    def total(self) -> int:
+        return len(self.groups)
+
+    @property
+    def unique(self) -> int:
+        return len(self.representatives)
+
+    @property
+    def ratio(self) -> float:
+        """Fraction of texts that were not scored because of a duplicate"""
+        return round(1 - self.unique / self.total, 4) if self.total else 0.0
+
+    def stats(self) -> dict:
+        return {'total_texts': self.total, 'unique_texts': self.unique, 'dedup_ratio': self.ratio}
+
+
+def canonical_key(text: str, normalizer: TextNormalizer) -> bytes:
+    """
+    Hash the canonical form of a text
+
+    Texts that normalize to nothing (e.g. only a URL or emoticons) are
+    keyed by their raw content, so they are merged only with exact copies.
+
+    Returns:
+        bytes: 16-byte blake2b digest
+    """
+    canonical = normalizer.normalize(text)
+    material = f'c\x1f{canonical}' if canonical else f'r\x1f{text}'
+    return hashlib.blake2b(material.encode('utf-8'), digest_size=16).digest()
+
+
+def plan_dedup(texts: List[str], normalizer: Optional[TextNormalizer] = None) -> DedupPlan:
+    """
+    Group texts whose canonical forms are identical
+
+    Args:
+        texts (List[str]): Input texts
+        normalizer (TextNormalizer): Canonicalization rules; a default
+            TextNormalizer if omitted
+
+    Returns:
+        DedupPlan: Representatives and per-text group indices, in input order
+    """
+    normalizer = normalizer or TextNormalizer()
+    seen = {}
+    representatives = []
+    groups = []
+    for i, text in enumerate(texts):
+        key = canonical_key(text, normalizer)
+        group = seen.get(key)
+        if group is None:
+            group = seen[key] = len(representatives)
+            representatives.append(i)
+        groups.append(group)
+    return DedupPlan(representatives, groups)
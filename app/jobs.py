@@ -0,0 +1,244 @@
+"""
+Job Queue Module
+================
+In-process asynchronous job queue for bulk sentiment analysis.
+
+Jobs are submitted with a large list of texts (size capped by the caller),
+queued, and processed chunk by chunk by background worker threads using
+SentimentAnalyzer.analyze_batch(). Clients poll for progress and page
+through results instead of holding a request open for the whole run.
+
+Results are kept as one columnar BatchResult per scored chunk (about 21
+bytes per text plus any processed text), not as a dictionary per text, so
+retained jobs stay small; result dictionaries are only built for the page
+being returned.
+"""
+
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import queue
+import threading
+import time
+import uuid
+from aggregation import SentimentAggregator
+from columnar import BatchResult
+
+
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class Job:
+    """State and results of one bulk analysis job"""
+
+    def __init__(self, texts: List[str], preprocess: str = 'none'):
+        self.id = uuid.uuid4().hex
+        self.texts = texts
+        self.preprocess = preprocess
+        self.status = QUEUED
+        self.total = len(texts)
+        self.processed = 0
+        self.parts: List[BatchResult] = []
+        self.aggregator = SentimentAggregator()
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_requested = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self, offset: int = 0, limit: int = 100) -> Dict:
+        """
+        Describe the job with one page of results
+
+        Args:
+            offset (int): Index of the first result to include
+            limit (int): Maximum number of results to include
+
+        Returns:
+            Dict with status, progress, timings, a results page and, once
+            the job has finished, summary statistics
+        """
+        page = self.results(offset, limit)
+        info = {
+            'job_id': self.id,
+            'status': self.status,
+            'total': self.total,
+            'processed': self.processed,
+            'progress': round(self.processed / self.total, 4) if self.total else 1.0,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'offset': offset,
+            'limit': limit,
+            'results': page,
+            'next_offset': offset + len(page) if offset + len(page) < self.processed else None
+        }
+        if self.error:
+            info['error'] = self.error
+        if self.finished:
+            info['summary'] = self.aggregator.summary()
+        return info
+
+    def results(self, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """Build result items offset..offset+limit from the stored chunks"""
+        items = []
+        start = 0
+        for part in list(self.parts):
+            end = start + len(part)
+            if len(items) >= limit:
+                break
+            if end > offset:
+                first = max(offset - start, 0)
+                rows = part.iter_dicts(first, first + limit - len(items))
+                for index, result in enumerate(rows, start + first):
+                    item = {'index': index, 'sentiment': result['sentiment'], 'scores': result['scores']}
+                    if self.preprocess != 'none':
+                        item['processed_text'] = result['processed_text']
+                    items.append(item)
+            start = end
+        return items
+
+
+class JobQueue:
+    """
+    Bounded in-process job queue served by background worker threads
+
+    Finished jobs are retained (oldest first evicted) so their results can
+    still be fetched after completion.
+    """
+
+    def __init__(
+        self,
+        analyzer,
+        workers: int = 2,
+        chunk_size: int = 1000,
+        max_pending: int = 100,
+        max_retained: int = 100,
+    ):
+        """
+        Args:
+            analyzer: SentimentAnalyzer used to score texts
+            workers (int): Number of worker threads
+            chunk_size (int): Texts scored per analyze_batch() call
+            max_pending (int): Maximum queued jobs before submissions are refused
+            max_retained (int): Maximum finished jobs kept for result retrieval
+        """
+        self.analyzer = analyzer
+        self.chunk_size = chunk_size
+        self.max_retained = max_retained
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+
+        for i in range(workers):
+            thread = threading.Thread(target=self._worker, name=f'sentiment-job-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, texts: List[str], preprocess: str = 'none') -> Job:
+        """
+        Queue a job
+
+        Raises:
+            QueueFullError: If max_pending jobs are already waiting
+        """
+        job = Job(texts, preprocess)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            raise QueueFullError('Job queue is full, try again later')
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, or None if unknown or evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a job
+
+        Queued and running jobs stop before their next chunk; finished jobs
+        are removed along with their results.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.finished:
+                del self._jobs[job_id]
+            else:
+                job.cancel_requested = True
+        return job
+
+    def stats(self) -> Dict:
+        """Return job counts by status"""
+        with self._lock:
+            counts = {state: 0 for state in (QUEUED, RUNNING) + FINISHED_STATES}
+            for job in self._jobs.values():
+                counts[job.status] += 1
+        counts['pending'] = self._queue.qsize()
+        return counts
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                self._run(job)
+            finally:
+                self._queue.task_done()
+                self._evict_finished()
+
+    def _run(self, job: Job) -> None:
+        if job.cancel_requested:
+            self._finish(job, CANCELLED)
+            return
+
+        job.status = RUNNING
+        job.started_at = time.time()
+        try:
+            for start in range(0, job.total, self.chunk_size):
+                if job.cancel_requested:
+                    self._finish(job, CANCELLED)
+                    return
+                chunk = job.texts[start:start + self.chunk_size]
+                results = self.analyzer.analyze_batch(chunk, preprocess=job.preprocess)
+                job.aggregator.add_many(results)
+                job.parts.append(BatchResult.from_results(results, keep_text=job.preprocess != 'none'))
+                job.processed += len(chunk)
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, FAILED)
+            return
+        self._finish(job, COMPLETED)
+
+    @staticmethod
+    def _finish(job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        # Inputs are no longer needed once scored
+        job.texts = []
+
+    def _evict_finished(self) -> None:
+        with self._lock:
+            finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+            for job_id in finished[:max(0, len(finished) - self.max_retained)]:
+                del self._jobs[job_id]
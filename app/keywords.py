@@ -0,0 +1,86 @@
+"""
+Keyword Extraction Module
+=========================
+Ranks the words that drive a text's VADER sentiment.
+
+Every token is resolved against the precomputed lexicon index used by the
+batch scorer, so the full VADER lexicon (not a hand-picked word list) is
+considered. A word's weight is its contextual valence after VADER's rules
+(boosters, negation, capitalisation, "but"), summed over its occurrences.
+Extraction needs one tokenization pass and no preprocessing; batch callers
+can rank the contributions the batch scorer already computed (see rank()).
+"""
+
+from typing import Dict, List, Sequence
+from vader_batch import VaderBatchScorer
+
+
+DEFAULT_TOP_K = 10
+
+# Decimal places for reported weights
+WEIGHT_DECIMALS = 4
+
+
+class KeywordExtractor:
+    """Top-k sentiment keyword extraction on top of a VaderBatchScorer"""
+
+    def __init__(self, scorer: VaderBatchScorer):
+        """
+        Args:
+            scorer (VaderBatchScorer): Scorer providing tokenization, the
+                lexicon index and VADER's contextual rules
+        """
+        self.scorer = scorer
+
+    def extract(self, text: str, top_k: int = DEFAULT_TOP_K) -> List[Dict]:
+        """
+        Return the top-k words contributing to the sentiment of text
+
+        Args:
+            text (str): Input text
+            top_k (int): Maximum number of keywords to return
+
+        Returns:
+            List of {'word', 'weight', 'count'} dicts ordered by absolute
+            weight, strongest first. Positive weights push the text towards
+            positive sentiment, negative weights towards negative.
+        """
+        tokens, sentiments = self.scorer.token_contributions(text)
+        return self.rank(tokens, sentiments, top_k)
+
+    @staticmethod
+    def rank(tokens: Sequence[str], sentiments: Sequence[float], top_k: int = DEFAULT_TOP_K) -> List[Dict]:
+        """
+        Rank words by their summed contributions
+
+        Args:
+            tokens (Sequence[str]): VADER tokens of a text
+            sentiments (Sequence[float]): Final valence of each token, as
+                VaderBatchScorer.token_contributions() returns them
+            top_k (int): Maximum number of keywords to return
+
+        Returns:
+            List of {'word', 'weight', 'count'} dicts, as extract() returns
+        """
+        weights = {}
+        counts = {}
+        for token, sentiment in zip(tokens, sentiments):
+            if not sentiment:
+                continue
+            word = token.lower()
+            weights[word] = weights.get(word, 0.0) + sentiment
+            counts[word] = counts.get(word, 0) + 1
+
+        ranked = sorted(weights, key=lambda word: (-abs(weights[word]), word))
+        return [
+            {
+                'word': word,
+                'weight': round(weights[word], WEIGHT_DECIMALS),
+                'count': counts[word]
+            }
+            for word in ranked[:top_k]
+        ]
+
+    def extract_batch(self, texts: Sequence[str], top_k: int = DEFAULT_TOP_K) -> List[List[Dict]]:
+        """Extract keywords for each text in texts"""
+        return [self.extract(text, top_k) for text in texts]
@@ -0,0 +1,164 @@
+"""
+Compact Lexicon Store
+=====================
+Memory-mapped, read-only VADER lexicon shared across worker processes.
+
+The lexicon is written once to a compact binary file: a sorted UTF-8 string
+table plus a float32 valence array. Every process that opens the file maps
+it read-only, so all workers share the same physical pages instead of each
+building its own Python dict.
+
+File layout (little-endian):
+    header    magic b'VLEX', version, word count, string table size (4 x uint32)
+    offsets   uint32[count + 1], start of each word in the string table
+    valences  float32[count]
+    strings   UTF-8 words, sorted, concatenated
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Iterator
+import mmap
+import struct
+import numpy as np
+
+
+MAGIC = b'VLEX'
+FORMAT_VERSION = 1
+HEADER = struct.Struct('<4sIII')
+
+# Distinct tokens whose lookup result is memoized per process
+LOOKUP_MEMO_SIZE = 50000
+
+# VADER valences have at most two decimal places; rounding the stored
+# float32 back to this many places restores the exact float64 value
+VALENCE_DECIMALS = 4
+
+
+def write_lexicon(lexicon: Dict[str, float], path: str) -> None:
+    """
+    Write a lexicon dictionary in the compact store format
+
+    Args:
+        lexicon (Dict[str, float]): Mapping of lowercase word to valence
+        path (str): Output file path
+    """
+    words = sorted(lexicon)
+    encoded = [word.encode('utf-8') for word in words]
+    offsets = np.zeros(len(words) + 1, dtype='<u4')
+    offsets[1:] = np.cumsum([len(word) for word in encoded])
+    valences = np.array([lexicon[word] for word in words], dtype='<f4')
+    strings = b''.join(encoded)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(words), len(strings)))
+        f.write(offsets.tobytes())
+        f.write(valences.tobytes())
+        f.write(strings)
+
+
+class _IdView(Mapping):
+    """Read-only word -> vocabulary id view of a MappedLexicon"""
+
+    def __init__(self, lexicon: 'MappedLexicon'):
+        self._lexicon = lexicon
+
+    def __getitem__(self, word: str) -> int:
+        idx = self._lexicon.index_of(word)
+        if idx < 0:
+            raise KeyError(word)
+        return idx
+
+    def __contains__(self, word) -> bool:
+        return self._lexicon.index_of(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._lexicon)
+
+    def __len__(self) -> int:
+        return len(self._lexicon)
+
+
+class MappedLexicon(Mapping):
+    """
+    Memory-mapped lexicon usable wherever VADER expects its lexicon dict
+
+    Acts as a read-only ``word -> valence`` mapping for
+    SentimentIntensityAnalyzer and exposes the same ``ids``, ``valences``,
+    ``index_of`` and ``valence`` interface as vader_batch.LexiconIndex. Lookups binary
+    search the mapped string table; results are memoized per process.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): File written by write_lexicon()
+
+        Raises:
+            ValueError: If the file is not a supported lexicon store
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, strings_size = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f'{path} is not a version {FORMAT_VERSION} lexicon store')
+
+        self.path = path
+        self._count = count
+        offsets_start = HEADER.size
+        valences_start = offsets_start + 4 * (count + 1)
+        self._strings_start = valences_start + 4 * count
+
+        self._offsets = np.frombuffer(self._mmap, dtype='<u4', count=count + 1, offset=offsets_start)
+        self.valences = np.frombuffer(self._mmap, dtype='<f4', count=count, offset=valences_start)
+        self.ids = _IdView(self)
+        self.index_of = lru_cache(maxsize=LOOKUP_MEMO_SIZE)(self._search)
+
+    def _word_bytes(self, idx: int) -> bytes:
+        start = self._strings_start + int(self._offsets[idx])
+        end = self._strings_start + int(self._offsets[idx + 1])
+        return self._mmap[start:end]
+
+    def word(self, idx: int) -> str:
+        """Return the word stored at a vocabulary id"""
+        return self._word_bytes(idx).decode('utf-8')
+
+    def _search(self, word: str) -> int:
+        """Binary search for word; returns its vocabulary id or -1"""
+        if not isinstance(word, str):
+            return -1
+        target = word.encode('utf-8')
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._word_bytes(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._count and self._word_bytes(lo) == target:
+            return lo
+        return -1
+
+    def valence(self, idx: int) -> float:
+        """Return the valence stored at a vocabulary id"""
+        return round(float(self.valences[idx]), VALENCE_DECIMALS)
+
+    def __getitem__(self, word: str) -> float:
+        idx = self.index_of(word)
+        if idx < 0:
+            raise KeyError(word)
+        return self.valence(idx)
+
+    def __contains__(self, word) -> bool:
+        return self.index_of(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.word(i) for i in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __reduce__(self):
+        # Re-open the mapping in the receiving process instead of copying it
+        return MappedLexicon, (self.path,)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Load Test Harness
+=================
+Concurrent load test of the HTTP API with latency SLO reporting.
+
+The app is started locally on a werkzeug server in a child process
+(threaded, or forking one process per request), or an already deployed
+server is targeted with --url. A seeded mix of /api/analyze, /api/batch and
+/api/upload requests, built from the benchmark corpora, is sent open-loop
+at a fixed target rate: requests are scheduled at evenly spaced times
+regardless of how fast earlier ones complete, and latency is measured from
+the scheduled time, so server slowdowns show up as latency instead of
+silently lowering the offered load.
+
+The report gives throughput, error rate and latency percentiles overall and
+per endpoint, and checks them against SLO thresholds. The exit status is 1
+if any SLO is missed, so the script can gate a deployment.
+
+Usage:
+    python load_test.py [--rps 50] [--duration 30] [--mix analyze=70,batch=20,upload=10]
+                        [--server threaded|processes] [--processes 4] [--url http://host:port]
+                        [--slo-p95-ms 250] [--slo-p99-ms 1000] [--slo-error-rate 0.01]
+                        [--output report.json]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import sys
+import threading
+import time
+import uuid
+from benchmark import APP_DIR, SEED, build_corpora, percentile
+
+
+ENDPOINTS = {'analyze': '/api/analyze', 'batch': '/api/batch', 'upload': '/api/upload'}
+DEFAULT_MIX = 'analyze=70,batch=20,upload=10'
+
+# Texts per /api/batch request
+BATCH_SIZE = 10
+
+REPORTED_PERCENTILES = (50, 90, 95, 99)
+
+# Default SLO thresholds
+SLO_P95_MS = 250.0
+SLO_P99_MS = 1000.0
+SLO_ERROR_RATE = 0.01
+
+# Achieved request rate below this fraction of the target fails the run
+SLO_MIN_RATE_FRACTION = 0.95
+
+# Seconds to wait for a local server to accept connections
+SERVER_START_TIMEOUT = 30.0
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse a traffic mix such as "analyze=70,batch=20,upload=10"
+
+    Returns:
+        Dict mapping endpoint names to weights
+
+    Raises:
+        ValueError: If an endpoint is unknown or a weight is not positive
+    """
+    mix = {}
+    for part in spec.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown endpoint '{name}'. Expected one of: {', '.join(ENDPOINTS)}")
+        try:
+            mix[name] = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Invalid weight for '{name}': {weight}") from None
+        if mix[name] <= 0:
+            raise ValueError(f"Weight for '{name}' must be positive")
+    return mix
+
+
+def build_request(kind: str, texts: List[str], rng: random.Random) -> Tuple[str, bytes, Dict[str, str]]:
+    """
+    Build one request of the given kind
+
+    Returns:
+        Tuple of (path, body, headers)
+    """
+    if kind == 'analyze':
+        body = json.dumps({'text': rng.choice(texts)}).encode('utf-8')
+        return ENDPOINTS[kind], body, {'Content-Type': 'application/json'}
+    if kind == 'batch':
+        body = json.dumps({'texts': rng.sample(texts, BATCH_SIZE)}).encode('utf-8')
+        return ENDPOINTS[kind], body, {'Content-Type': 'application/json'}
+
+    boundary = uuid.uuid4().hex
+    body = (
+        f'--{boundary}\r\n'
+        'Content-Disposition: form-data; name="file"; filename="review.txt"\r\n'
+        'Content-Type: text/plain\r\n\r\n'
+        f'{rng.choice(texts)}\r\n'
+        f'--{boundary}--\r\n'
+    ).encode('utf-8')
+    return ENDPOINTS[kind], body, {'Content-Type': f'multipart/form-data; boundary={boundary}'}
+
+
+def build_schedule(mix: Dict[str, float], rps: float, duration: float, seed: int = SEED) -> List[Tuple[float, str, str, bytes, Dict]]:
+    """
+    Pre-build every request with its send offset, so request construction
+    does not perturb the send rate
+
+    Returns:
+        List of (offset seconds, kind, path, body, headers), ordered by offset
+    """
+    rng = random.Random(seed)
+    corpora = build_corpora(seed)
+    texts = [text for corpus in corpora.values() for text in corpus]
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+
+    schedule = []
+    for i in range(int(rps * duration)):
+        kind = rng.choices(kinds, weights)[0]
+        schedule.append((i / rps, kind) + build_request(kind, texts, rng))
+    return schedule
+
+
+def _serve(server_mode: str, processes: int, port_queue) -> None:
+    """Child process entry point: serve the Flask app until terminated"""
+    os.chdir(APP_DIR)
+    sys.path.insert(0, APP_DIR)
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+
+    from werkzeug.serving import make_server
+    from app import app, sentiment_analyzer
+
+    # Load NLTK resources before serving (and, with forking, before the fork)
+    sentiment_analyzer.preload()
+    if server_mode == 'processes':
+        server = make_server('127.0.0.1', 0, app, processes=processes)
+    else:
+        server = make_server('127.0.0.1', 0, app, threaded=True)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_local_server(server_mode: str, processes: int) -> Tuple[str, multiprocessing.Process]:
+    """
+    Start the app in a child process
+
+    The load generator runs in this process, so it does not compete with
+    the server for the GIL.
+
+    Returns:
+        Tuple of (base URL, server process)
+    """
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(server_mode, processes, port_queue), daemon=True)
+    process.start()
+    port = port_queue.get(timeout=SERVER_START_TIMEOUT)
+
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while True:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            break
+        except OSError:
+            if time.monotonic() > deadline:
+                process.terminate()
+                raise RuntimeError('Local server did not start') from None
+            time.sleep(0.05)
+    return f'http://127.0.0.1:{port}', process
+
+
+def send_request(url: str, path: str, body: bytes, headers: Dict[str, str], timeout: float) -> int:
+    """Send one POST request and return its status code"""
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+    try:
+        connection.request('POST', parts.path.rstrip('/') + path, body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def run_load(url: str, schedule: List[Tuple], concurrency: int, timeout: float) -> Tuple[List[Dict], float]:
+    """
+    Send the schedule open-loop and collect one sample per request
+
+    Returns:
+        Tuple of (samples with kind, status, latency and error, elapsed
+        seconds from the first scheduled send to the last completion)
+    """
+    samples = []
+    lock = threading.Lock()
+
+    def task(scheduled: float, kind: str, path: str, body: bytes, headers: Dict) -> None:
+        status, error = None, None
+        try:
+            status = send_request(url, path, body, headers, timeout)
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+        finished = time.perf_counter()
+        with lock:
+            samples.append({
+                'kind': kind,
+                'status': status,
+                'error': error,
+                'latency': finished - scheduled,
+                'finished': finished
+            })
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for offset, kind, path, body, headers in schedule:
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(task, scheduled, kind, path, body, headers)
+
+    end = max((sample['finished'] for sample in samples), default=start)
+    return samples, end - start
+
+
+def summarize(samples: List[Dict], elapsed: float) -> Dict:
+    """Throughput, error rate, status counts and latency percentiles (ms)"""
+    ok = [sample for sample in samples if sample['status'] == 200]
+    latencies = sorted(sample['latency'] for sample in ok)
+    statuses = {}
+    for sample in samples:
+        key = str(sample['status']) if sample['status'] is not None else 'error'
+        statuses[key] = statuses.get(key, 0) + 1
+
+    summary = {
+        'requests': len(samples),
+        'succeeded': len(ok),
+        'errors': len(samples) - len(ok),
+        'error_rate': round((len(samples) - len(ok)) / len(samples), 4) if samples else 0.0,
+        'throughput_rps': round(len(ok) / elapsed, 2) if elapsed > 0 else 0.0,
+        'statuses': statuses,
+        'latency_ms': {
+            f'p{q}': round(percentile(latencies, q) * 1000, 2) for q in REPORTED_PERCENTILES
+        }
+    }
+    summary['latency_ms']['max'] = round(latencies[-1] * 1000, 2) if latencies else 0.0
+    summary['latency_ms']['mean'] = round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0
+    return summary
+
+
+def check_slos(summary: Dict, target_rps: float, p95_ms: float, p99_ms: float, error_rate: float) -> List[Dict]:
+    """
+    Compare the overall summary against SLO thresholds
+
+    Latency SLOs fail when no request succeeded, since there is no latency
+    to judge.
+    """
+    checks = [
+        ('p95_latency_ms', summary['latency_ms']['p95'], p95_ms, 'max'),
+        ('p99_latency_ms', summary['latency_ms']['p99'], p99_ms, 'max'),
+        ('error_rate', summary['error_rate'], error_rate, 'max'),
+        ('throughput_rps', summary['throughput_rps'], round(target_rps * SLO_MIN_RATE_FRACTION, 2), 'min'),
+    ]
+    return [
+        {
+            'name': name,
+            'actual': actual,
+            'threshold': threshold,
+            'passed': (actual <= threshold if bound == 'max' else actual >= threshold)
+            and (summary['succeeded'] > 0 or not name.endswith('_ms'))
+        }
+        for name, actual, threshold, bound in checks
+    ]
+
+
+def print_report(report: Dict) -> None:
+    rows = [('overall', report['overall'])] + list(report['endpoints'].items())
+    for name, summary in rows:
+        latency = summary['latency_ms']
+        print(
+            f"{name:<10} {summary['requests']:>7} req  {summary['throughput_rps']:>8.1f} ok/s  "
+            f"err {summary['error_rate'] * 100:>6.2f}%  p50 {latency['p50']:>8.1f} ms  "
+            f"p95 {latency['p95']:>8.1f} ms  p99 {latency['p99']:>8.1f} ms  max {latency['max']:>8.1f} ms"
+        )
+    for check in report['slo']:
+        status = 'PASS' if check['passed'] else 'FAIL'
+        print(f"{status}: {check['name']} = {check['actual']} (threshold {check['threshold']})")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Load test the sentiment API against latency SLOs')
+    parser.add_argument('--rps', type=float, default=50.0, help='target requests per second')
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of load to send')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'endpoint weights (default {DEFAULT_MIX})')
+    parser.add_argument('--url', help='target an existing server instead of starting one')
+    parser.add_argument('--server', choices=['threaded', 'processes'], default='threaded',
+                        help='local werkzeug server mode')
+    parser.add_argument('--processes', type=int, default=4, help='max forked processes with --server processes')
+    parser.add_argument('--concurrency', type=int, default=64, help='max requests in flight')
+    parser.add_argument('--timeout', type=float, default=10.0, help='per-request timeout in seconds')
+    parser.add_argument('--warmup', type=int, default=10, help='untimed requests per endpoint before the run')
+    parser.add_argument('--seed', type=int, default=SEED, help='seed for texts and request order')
+    parser.add_argument('--slo-p95-ms', type=float, default=SLO_P95_MS)
+    parser.add_argument('--slo-p99-ms', type=float, default=SLO_P99_MS)
+    parser.add_argument('--slo-error-rate', type=float, default=SLO_ERROR_RATE)
+    parser.add_argument('--output', help='write the report as JSON to this file')
+    args = parser.parse_args()
+
+    if args.rps <= 0 or args.duration <= 0:
+        parser.error('--rps and --duration must be positive')
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    schedule = build_schedule(mix, args.rps, args.duration, args.seed)
+    process: Optional[multiprocessing.Process] = None
+    url = args.url
+    if url is None:
+        url, process = start_local_server(args.server, args.processes)
+        print(f'Started {args.server} server at {url}')
+
+    try:
+        warmup = build_schedule(mix, args.warmup * len(mix), 1.0, args.seed + 1) if args.warmup else []
+        for _, _, path, body, headers in warmup:
+            try:
+                send_request(url, path, body, headers, args.timeout)
+            except (OSError, http.client.HTTPException):
+                # Failures are counted during the timed run
+                pass
+
+        print(f'Sending {len(schedule)} requests at {args.rps:g} req/s for {args.duration:g}s')
+        samples, elapsed = run_load(url, schedule, args.concurrency, args.timeout)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.join()
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version,
+        'platform': platform.platform(),
+        'url': args.url,
+        'server': None if args.url else args.server,
+        'processes': args.processes if not args.url and args.server == 'processes' else None,
+        'target_rps': args.rps,
+        'duration': args.duration,
+        'elapsed': round(elapsed, 3),
+        'mix': mix,
+        'seed': args.seed,
+        'overall': summarize(samples, elapsed),
+        'endpoints': {
+            kind: summarize([sample for sample in samples if sample['kind'] == kind], elapsed)
+            for kind in mix
+        },
+        'errors': sorted({sample['error'] for sample in samples if sample['error']})[:10]
+    }
+    report['slo'] = check_slos(
+        report['overall'], args.rps, args.slo_p95_ms, args.slo_p99_ms, args.slo_error_rate
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f'Report written to {args.output}')
+
+    return 0 if all(check['passed'] for check in report['slo']) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Metrics Module
+==============
+Lightweight hot-path instrumentation with Prometheus text exposition.
+
+Analysis stages are timed with ``timed(stage)`` and HTTP requests are
+counted per endpoint. When the registry is disabled, ``timed`` returns a
+shared no-op context manager, so instrumentation costs one function call.
+"""
+
+from contextlib import nullcontext
+from typing import Dict, List, Sequence, Tuple
+import bisect
+import threading
+import time
+
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+_NOOP = nullcontext()
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Return (le, cumulative count) pairs including +Inf"""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            pairs.append(('+Inf' if bound == float('inf') else f'{bound:g}', total))
+        return pairs
+
+
+class _StageTimer:
+    """Context manager recording elapsed time into a stage histogram"""
+
+    __slots__ = ('registry', 'stage', 'start')
+
+    def __init__(self, registry: 'MetricsRegistry', stage: str):
+        self.registry = registry
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe_stage(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of stage latencies and per-endpoint request metrics
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stages: Dict[str, Histogram] = {}
+        self._request_latency: Dict[str, Histogram] = {}
+        self._request_counts: Dict[Tuple[str, str, int], int] = {}
+
+    def timed(self, stage: str):
+        """Return a context manager timing one execution of stage"""
+        if not self.enabled:
+            return _NOOP
+        return _StageTimer(self, stage)
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = Histogram()
+            histogram.observe(seconds)
+
+    def observe_request(self, endpoint: str, method: str, status: int, seconds: float) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            key = (endpoint, method, status)
+            self._request_counts[key] = self._request_counts.get(key, 0) + 1
+            histogram = self._request_latency.get(endpoint)
+            if histogram is None:
+                histogram = self._request_latency[endpoint] = Histogram()
+            histogram.observe(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._request_latency.clear()
+            self._request_counts.clear()
+
+    def render_prometheus(self, gauges: Dict[str, float] = None) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+
+        Args:
+            gauges (Dict[str, float]): Extra gauge values to expose, by metric name
+
+        Returns:
+            str: Prometheus text format (version 0.0.4)
+        """
+        lines = []
+        with self._lock:
+            lines.append('# HELP sentiment_stage_seconds Time spent in analysis stages')
+            lines.append('# TYPE sentiment_stage_seconds histogram')
+            for stage, histogram in sorted(self._stages.items()):
+                _render_histogram(lines, 'sentiment_stage_seconds', f'stage="{stage}"', histogram)
+
+            lines.append('# HELP sentiment_http_requests_total HTTP requests by endpoint, method and status')
+            lines.append('# TYPE sentiment_http_requests_total counter')
+            for (endpoint, method, status), count in sorted(self._request_counts.items()):
+                lines.append(
+                    f'sentiment_http_requests_total{{endpoint="{endpoint}",method="{method}",status="{status}"}} {count}'
+                )
+
+            lines.append('# HELP sentiment_http_request_duration_seconds HTTP request latency by endpoint')
+            lines.append('# TYPE sentiment_http_request_duration_seconds histogram')
+            for endpoint, histogram in sorted(self._request_latency.items()):
+                _render_histogram(lines, 'sentiment_http_request_duration_seconds', f'endpoint="{endpoint}"', histogram)
+
+        for name, value in sorted((gauges or {}).items()):
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {value}')
+
+        return '\n'.join(lines) + '\n'
+
+
+def _render_histogram(lines: List[str], name: str, labels: str, histogram: Histogram) -> None:
+    for le, count in histogram.cumulative():
+        lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+    lines.append(f'{name}_sum{{{labels}}} {histogram.sum}')
+    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+
+
+# Process-wide registry used by the analyzer and the Flask app
+registry = MetricsRegistry()
+
+
+def timed(stage: str):
+    """Time a stage in the process-wide registry (no-op when disabled)"""
+    return registry.timed(stage)
@@ -0,0 +1,112 @@
+"""
+Parallel Execution Module
+=========================
+Process-pool backend for scoring large batches across CPU cores.
+
+Each worker process builds its own SentimentAnalyzer once at start-up,
+loading the resources its configured preprocessing mode needs (the VADER
+lexicon, plus stopwords and WordNet for 'light'/'full'), then scores
+chunks of texts with the vectorized batch path. Resources for other modes
+load on first use, so a missing optional corpus fails only the chunks that
+need it rather than every worker's start-up. SentimentAnalyzer dispatches to this
+backend from analyze_batch() when given an executor.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
+import os
+
+
+# Analyzer owned by the current worker process
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_options: Dict, preload: str) -> None:
+    """Build the worker's analyzer and warm up lazily loaded corpora"""
+    global _worker_analyzer
+    from sentiment_analyzer import SentimentAnalyzer
+
+    _worker_analyzer = SentimentAnalyzer(**analyzer_options)
+    # Resources load lazily; do it now rather than on the first chunk
+    _worker_analyzer.preload(preload)
+
+
+def _analyze_chunk(texts: List[str], preprocess: str) -> List[Dict]:
+    """Score one chunk inside a worker process"""
+    return _worker_analyzer.analyze_batch(texts, preprocess=preprocess)
+
+
+class ParallelExecutor:
+    """
+    Process pool that scores chunks of texts in parallel
+
+    Batches smaller than ``min_items`` are not worth the inter-process
+    round trip; callers should score those in-process (see should_dispatch).
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 256,
+        min_items: int = 512,
+        analyzer_options: Optional[Dict] = None,
+        preload: str = 'none'
+    ):
+        """
+        Args:
+            workers (int): Number of worker processes (defaults to CPU count)
+            chunk_size (int): Texts sent to a worker per task
+            min_items (int): Smallest batch that is dispatched to the pool
+            analyzer_options (Dict): Keyword arguments for each worker's
+                SentimentAnalyzer (e.g. snapshot, lexicon_path)
+            preload (str): Preprocessing mode whose resources workers load
+                at start-up
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.min_items = min_items
+        self.analyzer_options = analyzer_options or {}
+        self.preload = preload
+        self._pool = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Process pool, started on first use"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self.analyzer_options, self.preload)
+            )
+        return self._pool
+
+    def should_dispatch(self, count: int) -> bool:
+        """Return True if a batch of count texts should go to the pool"""
+        return count >= self.min_items
+
+    def map_batch(self, texts: List[str], preprocess: str = 'none', chunk_size: Optional[int] = None) -> List[Dict]:
+        """
+        Score texts in parallel, preserving input order
+
+        Args:
+            texts (List[str]): Texts to score
+            preprocess (str): Preprocessing mode passed to analyze_batch()
+            chunk_size (int): Texts per worker task; the executor's
+                chunk_size if omitted
+
+        Returns:
+            List of result dictionaries in the same format as analyze()
+        """
+        chunk_size = max(1, chunk_size or self.chunk_size)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        results = []
+        for chunk_results in self.pool.map(partial(_analyze_chunk, preprocess=preprocess), chunks):
+            results.extend(chunk_results)
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,293 @@
+"""
+Persistent Cache Module
+=======================
+SQLite-backed score cache shared across processes and restarts.
+
+Results are keyed by a hash of the normalized text, the result variant
+(preprocessing mode) and a fingerprint of the analyzer configuration
+(lexicon, stopwords, thresholds, scoring version). When the configuration
+changes, the fingerprint changes, so old entries can never be returned.
+Several configurations (say, the CLI and a server with different settings)
+can share one database; entries of unused configurations simply age out.
+
+Entries are evicted least recently used first once the entry-count or
+byte-size limit is exceeded. Each process keeps a running estimate of both,
+so a write that may cross a limit triggers an eviction pass right away. Hits refresh an entry's last-used time lazily:
+only entries not touched for TOUCH_INTERVAL seconds are queued, and queued
+updates are written with the next put_many() or eviction pass (or once
+TOUCH_BATCH are pending), so lookups do not take SQLite's write lock. The
+database runs in WAL mode, so several worker processes can read and write
+it concurrently.
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+# Rows written between exact checks of the limits, which also catch rows
+# written by other processes
+EVICTION_INTERVAL = 1000
+
+# Fraction of the limits kept after an eviction pass, so passes are rare
+EVICTION_TARGET = 0.9
+
+# Seconds a hit may leave an entry's last_used stale before it is refreshed
+TOUCH_INTERVAL = 60
+
+# Queued last_used refreshes that force a write from a lookup
+TOUCH_BATCH = 1000
+
+# Max keys per SQL statement (SQLite's default variable limit is 999)
+SQL_BATCH = 500
+
+
+class PersistentCache:
+    """
+    Thread-safe SQLite result cache
+
+    Same make_key/get/put interface as ResultCache, plus get_many/put_many
+    so batches use one transaction.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 1000000,
+        max_bytes: int = 1024 * 1024 * 1024,
+        normalize_whitespace: bool = True
+    ):
+        """
+        Args:
+            path (str): SQLite database file, created if missing
+            max_entries (int): Maximum number of stored results
+            max_bytes (int): Approximate upper bound on stored result bytes
+            normalize_whitespace (bool): Collapse runs of whitespace in keys
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.normalize_whitespace = normalize_whitespace
+        self.fingerprint = ''
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        self._pending_touches = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        with self._connection() as conn:
+            conn.executescript(SCHEMA)
+            # Upper-bound estimates of the stored rows and bytes
+            self._entries_estimate, self._bytes_estimate = self._totals(conn)
+
+    def set_fingerprint(self, fingerprint: str, purge: bool = False) -> int:
+        """
+        Bind the cache to an analyzer configuration
+
+        Entries written under other fingerprints are never returned, since
+        keys include the fingerprint, and are left to LRU eviction.
+
+        Args:
+            fingerprint (str): Configuration fingerprint
+            purge (bool): Delete other fingerprints' entries now; only safe
+                when no other configuration shares the database
+
+        Returns:
+            int: Number of deleted entries
+        """
+        self.fingerprint = fingerprint
+        if not purge:
+            return 0
+        with self._connection() as conn:
+            deleted = conn.execute('DELETE FROM results WHERE fingerprint != ?', (fingerprint,)).rowcount
+            totals = self._totals(conn)
+        with self._lock:
+            self._entries_estimate, self._bytes_estimate = totals
+        return deleted
+
+    def make_key(self, text: str, variant: Hashable = None) -> bytes:
+        """
+        Build the cache key for a text
+
+        Args:
+            text (str): Raw input text
+            variant (Hashable): Distinguishes results computed with different
+                options for the same text
+
+        Returns:
+            bytes: 16-byte digest of the fingerprint, variant and text
+        """
+        if self.normalize_whitespace:
+            text = ' '.join(text.split())
+        material = f'{self.fingerprint}\x1f{variant}\x1f{text}'
+        return hashlib.blake2b(material.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[Dict]:
+        """Return the cached result for key, or None on a miss"""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[Dict]]:
+        """Look up many keys with read-only queries; misses are None"""
+        found = {}
+        stale = []
+        now = time.time()
+        with self._connection() as conn:
+            for start in range(0, len(keys), SQL_BATCH):
+                batch = keys[start:start + SQL_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = conn.execute(
+                    f'SELECT key, result, last_used FROM results WHERE key IN ({placeholders})', batch
+                ).fetchall()
+                for key, result, last_used in rows:
+                    found[key] = result
+                    if last_used < now - TOUCH_INTERVAL:
+                        stale.append(key)
+
+        results = [json.loads(found[key]) if key in found else None for key in keys]
+        hits = sum(1 for result in results if result is not None)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+            self._pending_touches.update((key, now) for key in stale)
+            flush = len(self._pending_touches) >= TOUCH_BATCH
+        if flush:
+            with self._connection() as conn:
+                self._flush_touches(conn)
+        return results
+
+    def put(self, key: bytes, result: Dict) -> None:
+        """Store a result"""
+        self.put_many([(key, result)])
+
+    def put_many(self, items: Iterable[Tuple[bytes, Dict]]) -> None:
+        """Store many results in one transaction, evicting if over the limits"""
+        now = time.time()
+        rows = []
+        for key, result in items:
+            encoded = json.dumps(result, separators=(',', ':'))
+            rows.append((key, self.fingerprint, encoded, len(encoded) + len(key), now))
+        if not rows:
+            return
+
+        with self._connection() as conn:
+            self._flush_touches(conn)
+            conn.executemany(
+                'INSERT OR REPLACE INTO results (key, fingerprint, result, size, last_used) '
+                'VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+        with self._lock:
+            # Replaced keys are counted again, so the estimates only overshoot
+            self._entries_estimate += len(rows)
+            self._bytes_estimate += sum(row[3] for row in rows)
+            self._writes_since_check += len(rows)
+            check = (
+                self._entries_estimate > self.max_entries
+                or self._bytes_estimate > self.max_bytes
+                or self._writes_since_check >= EVICTION_INTERVAL
+            )
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until within the limits
+
+        Returns:
+            int: Number of evicted entries
+        """
+        evicted = 0
+        with self._connection() as conn:
+            self._flush_touches(conn)
+            count, size = self._totals(conn)
+            # The byte target is reached from the average entry size, which
+            # undershoots when the oldest entries are smaller; repeat until
+            # within the limits
+            while count > self.max_entries or size > self.max_bytes:
+                excess = count - int(self.max_entries * EVICTION_TARGET)
+                if size > self.max_bytes:
+                    average = size / count
+                    excess = max(excess, int((size - self.max_bytes * EVICTION_TARGET) / average) + 1)
+                evicted += conn.execute(
+                    'DELETE FROM results WHERE key IN '
+                    '(SELECT key FROM results ORDER BY last_used LIMIT ?)',
+                    (excess,)
+                ).rowcount
+                count, size = self._totals(conn)
+
+        with self._lock:
+            self.evictions += evicted
+            self._entries_estimate, self._bytes_estimate = count, size
+        return evicted
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._connection() as conn:
+            conn.execute('DELETE FROM results')
+        with self._lock:
+            self._entries_estimate, self._bytes_estimate = 0, 0
+
+    def stats(self) -> Dict:
+        """Return cache counters and current size"""
+        with self._connection() as conn:
+            count, size = self._totals(conn)
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'path': self.path,
+                'entries': count,
+                'bytes': size,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions
+            }
+
+    @staticmethod
+    def _totals(conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Return the stored row count and byte size"""
+        return conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results').fetchone()
+
+    def _flush_touches(self, conn: sqlite3.Connection) -> None:
+        """Write queued last_used refreshes inside conn's transaction"""
+        with self._lock:
+            touches, self._pending_touches = self._pending_touches, {}
+        if touches:
+            conn.executemany(
+                'UPDATE results SET last_used = MAX(last_used, ?) WHERE key = ?',
+                [(used, key) for key, used in touches.items()]
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection (used as a transaction context)"""
+        # Connections must not be shared with forked worker processes
+        if getattr(self._local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return self._local.conn
@@ -0,0 +1,179 @@
+"""
+NLTK Resources Module
+=====================
+Locating, downloading and snapshotting the NLTK data used by the analyzer.
+
+Nothing here touches the network unless explicitly asked to. Resources are
+loaded lazily by SentimentAnalyzer on first use; for fork-friendly
+preloading, the VADER lexicon and stopword list can be saved to a compact
+pickle snapshot that loads without parsing the NLTK data files.
+
+Usage:
+    python resources.py download            # fetch missing NLTK data
+    python resources.py snapshot nltk.pkl   # write a lexicon/stopword snapshot
+    python resources.py lexicon vader.vlex  # write a memory-mappable lexicon store
+"""
+
+from typing import Dict, List, Optional, Set
+import pickle
+import ssl
+import sys
+
+
+# (resource path for nltk.data.find, package name for nltk.download)
+NLTK_RESOURCES = [
+    ('sentiment/vader_lexicon.zip', 'vader_lexicon'),
+    ('tokenizers/punkt', 'punkt'),
+    ('corpora/stopwords', 'stopwords'),
+    ('corpora/wordnet', 'wordnet'),
+]
+
+SNAPSHOT_VERSION = 1
+
+
+def missing_resources() -> List[str]:
+    """Return the package names of NLTK resources not installed locally"""
+    import nltk
+
+    missing = []
+    for path, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(package)
+    return missing
+
+
+def ensure_resources(download: bool = False) -> List[str]:
+    """
+    Check for required NLTK data, optionally downloading what is missing
+
+    Args:
+        download (bool): Download missing resources from the NLTK index
+
+    Returns:
+        List[str]: Package names that are still missing
+    """
+    missing = missing_resources()
+    if not missing or not download:
+        return missing
+
+    import nltk
+
+    # Handle SSL certificate verification issues
+    try:
+        _create_unverified_https_context = ssl._create_unverified_context
+    except AttributeError:
+        pass
+    else:
+        ssl._create_default_https_context = _create_unverified_https_context
+
+    for package in missing:
+        nltk.download(package)
+    return missing_resources()
+
+
+def load_vader_lexicon() -> Dict[str, float]:
+    """Parse the VADER lexicon shipped with NLTK"""
+    from nltk.sentiment import SentimentIntensityAnalyzer
+
+    return SentimentIntensityAnalyzer().lexicon
+
+
+def load_stopwords() -> Set[str]:
+    """Load the English stopword list"""
+    from nltk.corpus import stopwords
+
+    return set(stopwords.words('english'))
+
+
+def build_vader(lexicon: Optional[Dict[str, float]] = None):
+    """
+    Build a SentimentIntensityAnalyzer
+
+    Args:
+        lexicon (Dict[str, float]): Prebuilt lexicon; when given, the NLTK
+            lexicon file is not read or parsed
+
+    Returns:
+        SentimentIntensityAnalyzer
+    """
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    from nltk.sentiment.vader import VaderConstants
+
+    if lexicon is None:
+        return SentimentIntensityAnalyzer()
+
+    sia = SentimentIntensityAnalyzer.__new__(SentimentIntensityAnalyzer)
+    sia.lexicon_file = None
+    sia.lexicon = lexicon
+    sia.constants = VaderConstants()
+    return sia
+
+
+def save_snapshot(path: str) -> None:
+    """
+    Write the VADER lexicon and stopwords to a pickle snapshot
+
+    Args:
+        path (str): Output file path
+    """
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'lexicon': load_vader_lexicon(),
+        'stopwords': sorted(load_stopwords())
+    }
+    with open(path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(path: str) -> Dict:
+    """
+    Load a snapshot written by save_snapshot()
+
+    Only load snapshots you created yourself: pickle files can execute code.
+
+    Returns:
+        Dict with 'lexicon' (Dict[str, float]) and 'stopwords' (Set[str])
+
+    Raises:
+        ValueError: If the snapshot format version is not supported
+    """
+    with open(path, 'rb') as f:
+        snapshot = pickle.load(f)
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported snapshot version: {snapshot.get("version")}')
+
+    return {
+        'lexicon': snapshot['lexicon'],
+        'stopwords': set(snapshot['stopwords'])
+    }
+
+
+def main(argv: List[str]) -> int:
+    if len(argv) >= 1 and argv[0] == 'download':
+        still_missing = ensure_resources(download=True)
+        if still_missing:
+            print(f"Could not download: {', '.join(still_missing)}")
+            return 1
+        print('All NLTK resources are installed')
+        return 0
+
+    if len(argv) == 2 and argv[0] == 'lexicon':
+        from lexicon_store import write_lexicon
+        write_lexicon(load_vader_lexicon(), argv[1])
+        print(f'Lexicon store written to {argv[1]}')
+        return 0
+
+    if len(argv) == 2 and argv[0] == 'snapshot':
+        save_snapshot(argv[1])
+        print(f'Snapshot written to {argv[1]}')
+        return 0
+
+    print(__doc__)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
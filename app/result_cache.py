@@ -0,0 +1,161 @@
+"""
+Result Cache Module
+===================
+Bounded, thread-safe LRU cache for sentiment analysis results.
+
+Entries are keyed by a normalized form of the input text so that duplicate
+texts (canned replies, retweets, re-posted reviews) are served from memory
+instead of being re-scored.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import sys
+import threading
+import time
+
+
+# Approximate memory used by a cached result dict with its nested scores dict
+RESULT_OVERHEAD_BYTES = 1200
+
+
+class ResultCache:
+    """
+    LRU cache with entry-count, byte-size and TTL bounds
+
+    Stores analysis result dictionaries. Returned results are shallow copies
+    (including the nested ``scores`` dict) so callers cannot mutate cached
+    entries.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None,
+        normalize_whitespace: bool = True,
+        ignore_case: bool = False,
+    ):
+        """
+        Args:
+            max_entries (int): Maximum number of cached results
+            max_bytes (int): Approximate upper bound on cached memory
+            ttl (float): Seconds before an entry expires; None disables expiry
+            normalize_whitespace (bool): Collapse runs of whitespace in keys
+            ignore_case (bool): Case-insensitive keys. Note that VADER boosts
+                ALL-CAPS words, so this trades exactness for hit rate
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.normalize_whitespace = normalize_whitespace
+        self.ignore_case = ignore_case
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def make_key(self, text: str, variant: Hashable = None) -> Tuple:
+        """
+        Build the cache key for a text
+
+        Args:
+            text (str): Raw input text
+            variant (Hashable): Distinguishes results computed with different
+                options for the same text
+
+        Returns:
+            Hashable cache key
+        """
+        if self.normalize_whitespace:
+            text = ' '.join(text.split())
+        if self.ignore_case:
+            text = text.casefold()
+        return variant, text
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Return a copy of the cached result for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            result, size, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return self._copy(result)
+
+    def put(self, key: Tuple, result: Dict) -> None:
+        """Store a result, evicting least recently used entries if needed"""
+        size = self._estimate_size(key, result)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+
+            self._entries[key] = (self._copy(result), size, expires_at)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Return cache counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Tuple, size: int) -> None:
+        del self._entries[key]
+        self._bytes -= size
+
+    @staticmethod
+    def _copy(result: Dict) -> Dict:
+        copied = dict(result)
+        copied['scores'] = dict(result['scores'])
+        return copied
+
+    @staticmethod
+    def _estimate_size(key: Tuple, result: Dict) -> int:
+        return (
+            sys.getsizeof(key[1])
+            + sys.getsizeof(result.get('processed_text', ''))
+            + RESULT_OVERHEAD_BYTES
+        )
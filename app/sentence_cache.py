@@ -0,0 +1,213 @@
+"""
+Sentence Cache Module
+=====================
+Sentence-granularity memo of VADER token contributions.
+
+Long documents often repeat sentences (signatures, disclaimers, templated
+phrasing). This cache stores each sentence's tokens and per-token valences
+before the "but" adjustment, keyed by the sentence text, and recomposes
+document scores from them. Only sentences not seen before are tokenized
+and run through the rule engine.
+
+Recomposition reproduces what VADER computes on the whole document:
+
+- VADER scores every occurrence of a token at the token's first position
+  in the document, so a token repeated from an earlier sentence takes the
+  valence of that first occurrence.
+- VADER's rules read up to three tokens back and two ahead (boosters,
+  negation, idioms, "least", "kind of"), so lexicon hits that close to a
+  sentence boundary are re-scored in document context. That score depends
+  only on the surrounding window of tokens, so it is memoized per window.
+- Capitalisation emphasis depends on whether the whole document mixes
+  ALL-CAPS and other tokens; sentences that disagree with the document are
+  re-scored in document context.
+- The "but" rule and punctuation emphasis are applied document-wide.
+
+Texts the splitter leaves as one sentence, or splits inside a word
+(sent_tokenize splits "!!!" into three "!" sentences), are cached whole.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, NamedTuple, Sequence, Tuple
+import threading
+import numpy as np
+from vader_batch import BatchScores, VaderBatchScorer
+
+
+# Tokens VADER's rules read before and after a lexicon hit
+RULE_LOOKBEHIND = 3
+RULE_LOOKAHEAD = 2
+
+
+class SentenceEntry(NamedTuple):
+    """Cached analysis of one sentence"""
+    tokens: Tuple[str, ...]
+    sentiments: Tuple[float, ...]  # valences before the "but" adjustment
+    hits: FrozenSet[int]  # positions of tokens scored by VADER's rules
+    but_index: int  # first "but" token, or -1
+    allcaps: int  # ALL-CAPS tokens
+    is_cap_diff: bool
+
+
+class SentenceContributionCache:
+    """LRU cache of per-sentence VADER contributions with document recomposition"""
+
+    def __init__(
+        self,
+        scorer: VaderBatchScorer,
+        splitter: Callable[[str], List[str]],
+        max_entries: int = 100000
+    ):
+        """
+        Args:
+            scorer (VaderBatchScorer): Provides tokenization, VADER's rules
+                and vectorized score aggregation
+            splitter (Callable[[str], List[str]]): Splits a document into
+                sentences
+            max_entries (int): Maximum number of cached sentences
+        """
+        self.scorer = scorer
+        self.splitter = splitter
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._window_valence = lru_cache(maxsize=max_entries)(self._score_window)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def contributions(self, sentence: str) -> SentenceEntry:
+        """Return a sentence's cached analysis, computing it on a miss"""
+        with self._lock:
+            entry = self._entries.get(sentence)
+            if entry is not None:
+                self._entries.move_to_end(sentence)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        scorer = self.scorer
+        tokens, is_cap_diff = scorer.tokenize(sentence)
+        entry = SentenceEntry(
+            tokens=tuple(tokens),
+            sentiments=tuple(scorer.token_sentiments(tokens, is_cap_diff)),
+            hits=frozenset(pos for pos, token in enumerate(tokens) if scorer.is_lexicon_hit(token)),
+            but_index=scorer.but_index(tokens),
+            allcaps=sum(1 for token in tokens if token.isupper()),
+            is_cap_diff=is_cap_diff
+        )
+
+        with self._lock:
+            self._entries[sentence] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def sentences(self, text: str) -> List[str]:
+        """
+        Split text into the units whose contributions are cached
+
+        Returns [text] when the splitter finds one sentence or splits inside
+        a whitespace-delimited word, since VADER tokenizes on whitespace.
+        """
+        sentences = self.splitter(text)
+        if len(sentences) > 1 and [word for sentence in sentences for word in sentence.split()] == text.split():
+            return sentences
+        return [text]
+
+    def score(self, texts: Sequence[str]) -> BatchScores:
+        """
+        Score texts from cached sentence contributions
+
+        Args:
+            texts (Sequence[str]): Raw input texts
+
+        Returns:
+            BatchScores with unrounded float64 arrays, as
+            VaderBatchScorer.score() returns
+        """
+        flat = []
+        text_ids = []
+        but_factors = []
+        for text_id, text in enumerate(texts):
+            entries = [self.contributions(sentence) for sentence in self.sentences(text)]
+            if len(entries) == 1:
+                sentiments, but_position = entries[0].sentiments, entries[0].but_index
+            else:
+                sentiments, but_position = self._recompose(entries)
+            if but_position >= 0:
+                but_factors.append((len(flat), but_position, len(sentiments)))
+            flat.extend(sentiments)
+            text_ids.extend([text_id] * len(sentiments))
+
+        return self.scorer.score_sentiments(
+            np.asarray(flat, dtype=np.float64),
+            np.asarray(text_ids, dtype=np.intp),
+            texts,
+            but_factors,
+        )
+
+    def _recompose(self, entries: List[SentenceEntry]) -> Tuple[List[float], int]:
+        """
+        Join sentence entries into the document's token valences
+
+        Returns:
+            Tuple of (valences before the "but" adjustment, position of the
+            document's first "but" or -1), as VADER computes them on the
+            concatenated tokens
+        """
+        tokens = [token for entry in entries for token in entry.tokens]
+        allcaps = sum(entry.allcaps for entry in entries)
+        is_cap_diff = 0 < len(tokens) - allcaps < len(tokens)
+
+        first_index = {}
+        sentiments = []
+        but_position = -1
+        offset = 0
+        last = len(entries) - 1
+        for k, entry in enumerate(entries):
+            if but_position < 0 and entry.but_index >= 0:
+                but_position = offset + entry.but_index
+            count = len(entry.tokens)
+            # Positions whose cached valence came from sentence-only context
+            head = RULE_LOOKBEHIND if k > 0 else 0
+            tail = count - RULE_LOOKAHEAD if k < last else count
+            recheck = entry.hits if entry.is_cap_diff != is_cap_diff else [
+                pos for pos in entry.hits if pos < head or pos >= tail
+            ]
+            valences = list(entry.sentiments)
+            for pos in recheck:
+                valences[pos] = None
+
+            for pos, (token, valence) in enumerate(zip(entry.tokens, valences)):
+                first = first_index.setdefault(token, offset + pos)
+                if first < offset + pos:
+                    valence = sentiments[first]
+                elif valence is None:
+                    start = max(0, first - RULE_LOOKBEHIND)
+                    window = tuple(tokens[start:first + RULE_LOOKAHEAD + 1])
+                    valence = self._window_valence(window, first - start, is_cap_diff)
+                sentiments.append(valence)
+            offset += count
+        return sentiments, but_position
+
+    def _score_window(self, window: Tuple[str, ...], i: int, is_cap_diff: bool) -> float:
+        """Valence of window[i] given the tokens VADER's rules can see around it"""
+        return self.scorer.valence_at(list(window), is_cap_diff, i)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        self._window_valence.cache_clear()
+
+    def stats(self) -> Dict:
+        """Return cache counters and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -6,49 +6,41 @@ Provides comprehensive text preprocessing including tokenization, stemming, and
 
 """
 
-import nltk
-import ssl
-from nltk.sentiment import SentimentIntensityAnalyzer
-from nltk.tokenize import word_tokenize, sent_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import PorterStemmer, WordNetLemmatizer
-import re
-from typing import Dict, List, Tuple
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
 import string
+from vader_batch import VaderBatchScorer
+from result_cache import ResultCache
+from persistent_cache import PersistentCache
+from preprocessing import PreprocessingPipeline, validate_mode
+from aggregation import SentimentAggregator
+from metrics import timed
+from lexicon_store import MappedLexicon
+from keywords import KeywordExtractor, DEFAULT_TOP_K
+from sentence_cache import SentenceContributionCache
+from dedup import plan_dedup
+from columnar import BatchResult
+from streaming import iter_chunks
+from chunking import split_chunks, weighted_scores
+import resources
 
-# Handle SSL certificate verification issues
-try:
-    _create_unverified_https_context = ssl._create_unverified_context
-except AttributeError:
-    pass
-else:
-    ssl._create_default_https_context = _create_unverified_https_context
+# Compound score thresholds used to classify sentiment
+POSITIVE_THRESHOLD = 0.05
+NEGATIVE_THRESHOLD = -0.05
 
-# Download required NLTK data
-try:
-    nltk.data.find('vader_lexicon')
-except LookupError:
-    nltk.download('vader_lexicon')
+# Bump when scoring or preprocessing changes, so persisted results are invalidated
+SCORING_VERSION = 1
 
-try:
-    nltk.data.find('punkt')
-except LookupError:
-    nltk.download('punkt')
+# Texts scored per analyze_batch() call when building a columnar result
+COLUMNAR_CHUNK_SIZE = 1000
 
-try:
-    nltk.data.find('stopwords')
-except LookupError:
-    nltk.download('stopwords')
+# Longest chunk scored at once by analyze_long(), in characters
+LONG_DOCUMENT_CHUNK_CHARS = 5000
 
-try:
-    nltk.data.find('wordnet')
-except LookupError:
-    nltk.download('wordnet')
-
-try:
-    nltk.data.find('averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger')
+# Fewest chunks for which analyze_long() uses the parallel executor
+LONG_DOCUMENT_PARALLEL_MIN_CHUNKS = 8
 
 
 class SentimentAnalyzer:
@@ -62,13 +54,140 @@ class SentimentAnalyzer:
     - Multi-word expressions
     """
     
-    def __init__(self):
-        """Initialize the sentiment analyzer with NLTK tools"""
-        self.sia = SentimentIntensityAnalyzer()
-        self.stemmer = PorterStemmer()
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(
+        self,
+        cache: Optional[ResultCache] = None,
+        executor=None,
+        snapshot: Optional[str] = None,
+        lexicon_path: Optional[str] = None,
+        persistent_cache: Optional[PersistentCache] = None,
+        sentence_cache_size: int = 0
+    ):
+        """
+        Initialize the sentiment analyzer
+        
+        NLTK tools are loaded lazily on first use; call preload() to load
+        them up front (e.g. before forking worker processes).
         
+        Args:
+            cache (ResultCache): Optional result cache consulted by analyze()
+                and analyze_batch() before scoring
+            executor: Optional ParallelExecutor that large batches are
+                dispatched to
+            snapshot (str): Optional path to a snapshot written by
+                resources.save_snapshot(), used instead of the NLTK lexicon
+                and stopword files
+            lexicon_path (str): Optional compact lexicon store written by
+                lexicon_store.write_lexicon(); memory-mapped read-only so
+                worker processes share one copy. Takes precedence over the
+                snapshot's lexicon
+            persistent_cache (PersistentCache): Optional on-disk cache
+                consulted after the in-memory cache, shared across processes
+                and restarts
+            sentence_cache_size (int): When positive, score documents from a
+                cache of this many per-sentence VADER contributions. Faster
+                on texts with repeated sentences; scores are unchanged (see
+                sentence_cache.py)
+        """
+        self.cache = cache
+        self.persistent_cache = persistent_cache
+        self.sentence_cache_size = sentence_cache_size
+        self.executor = executor
+        self._snapshot = resources.load_snapshot(snapshot) if snapshot else None
+        self._lexicon_path = lexicon_path
+    
+    @cached_property
+    def mapped_lexicon(self) -> Optional[MappedLexicon]:
+        """Memory-mapped lexicon store, if one was configured"""
+        return MappedLexicon(self._lexicon_path) if self._lexicon_path else None
+    
+    @cached_property
+    def sia(self):
+        """VADER SentimentIntensityAnalyzer"""
+        if self.mapped_lexicon is not None:
+            return resources.build_vader(self.mapped_lexicon)
+        lexicon = self._snapshot['lexicon'] if self._snapshot else None
+        return resources.build_vader(lexicon)
+    
+    @cached_property
+    def stop_words(self) -> set:
+        """English stopwords"""
+        if self._snapshot:
+            return self._snapshot['stopwords']
+        return resources.load_stopwords()
+    
+    @cached_property
+    def stemmer(self):
+        """Porter stemmer"""
+        from nltk.stem import PorterStemmer
+        return PorterStemmer()
+    
+    @cached_property
+    def lemmatizer(self):
+        """WordNet lemmatizer (WordNet itself loads on first lemmatize call)"""
+        from nltk.stem import WordNetLemmatizer
+        return WordNetLemmatizer()
+    
+    @cached_property
+    def pipeline(self) -> PreprocessingPipeline:
+        """Lazy preprocessing pipeline with per-token memo caches"""
+        return PreprocessingPipeline(self.stop_words, self.stemmer, self.lemmatizer)
+    
+    @cached_property
+    def batch_scorer(self) -> VaderBatchScorer:
+        """Vectorized VADER scorer sharing this analyzer's lexicon"""
+        return VaderBatchScorer(self.sia, index=self.mapped_lexicon)
+    
+    @cached_property
+    def keyword_extractor(self) -> KeywordExtractor:
+        """Sentiment keyword extractor over the full VADER lexicon"""
+        return KeywordExtractor(self.batch_scorer)
+    
+    @cached_property
+    def sentence_cache(self) -> Optional[SentenceContributionCache]:
+        """Per-sentence contribution cache, if enabled"""
+        if self.sentence_cache_size <= 0:
+            return None
+        return SentenceContributionCache(
+            self.batch_scorer, self.split_sentences, max_entries=self.sentence_cache_size
+        )
+    
+    @cached_property
+    def config_fingerprint(self) -> str:
+        """Hash of everything that affects results: lexicon, stopwords, thresholds, version"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'version': SCORING_VERSION,
+            'thresholds': [POSITIVE_THRESHOLD, NEGATIVE_THRESHOLD],
+            'sentence_cache': self.sentence_cache_size > 0,
+            'stopwords': sorted(self.stop_words)
+        }).encode('utf-8'))
+        for word, valence in sorted(self.sia.lexicon.items()):
+            digest.update(f'{word}\t{valence!r}\n'.encode('utf-8'))
+        return digest.hexdigest()
+    
+    @cached_property
+    def _persistent(self) -> Optional[PersistentCache]:
+        """The persistent cache, bound to this analyzer's configuration"""
+        if self.persistent_cache is not None:
+            self.persistent_cache.set_fingerprint(self.config_fingerprint)
+        return self.persistent_cache
+    
+    def preload(self, preprocess: str = 'full') -> None:
+        """
+        Load the NLTK resources a preprocessing mode needs now instead of on first use
+        
+        Args:
+            preprocess (str): Mode to prepare for; 'none' loads the VADER
+                lexicon, 'light' adds stopwords and 'full' adds WordNet
+        """
+        validate_mode(preprocess)
+        self.batch_scorer
+        if preprocess != 'none':
+            self.pipeline
+        if preprocess == 'full':
+            self.lemmatizer.lemmatize('warmup')
+    
     def preprocess_text(self, text: str) -> Tuple[str, List[str], List[str]]:
         """
         Preprocess the input text for sentiment analysis
@@ -90,38 +209,11 @@ class SentimentAnalyzer:
             - tokens (List[str]): Tokens after preprocessing
             - lemmatized_tokens (List[str]): Lemmatized tokens
         """
-        # 1. Convert to lowercase
-        text = text.lower()
-        
-        # 2. Remove URLs
-        text = re.sub(r'http\S+|www\S+|https\S+', '', text, flags=re.MULTILINE)
-        
-        # 3. Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # 4. Remove special characters but keep important punctuation
-        text = re.sub(r'[^\w\s.!?,-]', '', text)
-        
-        # 5. Handle multiple spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        # 6. Tokenization
-        tokens = word_tokenize(text)
+        stages = self.pipeline.run(text)
         
-        # 7. Remove stopwords (optional - keeping for context preservation)
-        filtered_tokens = [token for token in tokens if token not in self.stop_words]
-        
-        # 8. Stemming
-        stemmed_tokens = [self.stemmer.stem(token) for token in filtered_tokens]
-        
-        # 9. Lemmatization
-        lemmatized_tokens = [self.lemmatizer.lemmatize(token) for token in filtered_tokens]
-        
-        processed_text = ' '.join(lemmatized_tokens)
-        
-        return processed_text, stemmed_tokens, lemmatized_tokens
+        return stages.processed_text('full'), stages.stemmed_tokens, stages.lemmatized_tokens
     
-    def analyze(self, text: str) -> Dict:
+    def analyze(self, text: str, preprocess: str = 'full') -> Dict:
         """
         Analyze sentiment of the given text
         
@@ -138,6 +230,8 @@ class SentimentAnalyzer:
         
         Args:
             text (str): Input text to analyze
+            preprocess (str): Preprocessing mode for processed_text
+                ('none', 'light' or 'full'); scores are unaffected
             
         Returns:
             Dict containing:
@@ -147,37 +241,318 @@ class SentimentAnalyzer:
             - confidence: float indicating confidence level
         """
         if not text or not text.strip():
-            return {
-                'sentiment': 'neutral',
-                'scores': {
-                    'positive': 0.0,
-                    'negative': 0.0,
-                    'neutral': 1.0,
-                    'compound': 0.0
-                },
-                'processed_text': '',
-                'confidence': 0.0
-            }
+            return self._empty_result()
+        
+        validate_mode(preprocess)
+        
+        if self.cache is not None:
+            cache_key = self.cache.make_key(text, preprocess)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        if self._persistent is not None:
+            persistent_key = self._persistent.make_key(text, preprocess)
+            stored = self._persistent.get(persistent_key)
+            if stored is not None:
+                if self.cache is not None:
+                    self.cache.put(cache_key, stored)
+                return stored
         
         # Get VADER sentiment scores
-        scores = self.sia.polarity_scores(text)
+        with timed('vader_polarity'):
+            if self.sentence_cache is not None:
+                scores = self.batch_scorer.to_polarity_dict(self.sentence_cache.score([text]), 0)
+            else:
+                scores = self.sia.polarity_scores(text)
+        
+        # Preprocess the text, computing only the stages the mode needs
+        processed_text = self.pipeline.processed_text(text, preprocess)
+        
+        result = self._build_result(scores, processed_text)
+        
+        if self.cache is not None:
+            self.cache.put(cache_key, result)
+        if self._persistent is not None:
+            self._persistent.put(persistent_key, result)
+        
+        return result
+    
+    def analyze_batch(self, texts: List[str], preprocess: str = 'none') -> List[Dict]:
+        """
+        Analyze sentiment of many texts in one vectorized pass
+        
+        All texts are tokenized once and scored together by the
+        VaderBatchScorer, so per-text Python overhead is paid only for
+        lexicon hits. Scores are identical to calling analyze() per text.
+        
+        Args:
+            texts (List[str]): Input texts to analyze
+            preprocess (str): Preprocessing mode for processed_text; 'none'
+                by default since batch callers rarely need it
+            
+        Returns:
+            List of result dictionaries in the same format as analyze()
+        """
+        validate_mode(preprocess)
+        results = [None] * len(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = self._empty_result()
+                continue
+            
+            if self.cache is not None:
+                cached = self.cache.get(self.cache.make_key(text, preprocess))
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            
+            pending.append(i)
+        
+        if self._persistent is not None and pending:
+            persistent_keys = [self._persistent.make_key(texts[i], preprocess) for i in pending]
+            still_pending = []
+            for i, stored in zip(pending, self._persistent.get_many(persistent_keys)):
+                if stored is None:
+                    still_pending.append(i)
+                    continue
+                results[i] = stored
+                if self.cache is not None:
+                    self.cache.put(self.cache.make_key(texts[i], preprocess), stored)
+            pending = still_pending
+        
+        pending_texts = [texts[i] for i in pending]
+        
+        if self.executor is not None and self.executor.should_dispatch(len(pending)):
+            computed = self.executor.map_batch(pending_texts, preprocess)
+        else:
+            with timed('vader_batch'):
+                if self.sentence_cache is not None:
+                    scores = self.sentence_cache.score(pending_texts)
+                else:
+                    scores = self.batch_scorer.score(pending_texts)
+            computed = [
+                self._build_result(
+                    self.batch_scorer.to_polarity_dict(scores, j),
+                    self.pipeline.processed_text(text, preprocess)
+                )
+                for j, text in enumerate(pending_texts)
+            ]
+        
+        for i, result in zip(pending, computed):
+            results[i] = result
+            
+            if self.cache is not None:
+                self.cache.put(self.cache.make_key(texts[i], preprocess), result)
+        
+        if self._persistent is not None:
+            self._persistent.put_many(
+                (self._persistent.make_key(texts[i], preprocess), results[i]) for i in pending
+            )
+        
+        return results
+    
+    def analyze_batch_keywords(
+        self,
+        texts: List[str],
+        preprocess: str = 'none',
+        top_k: int = DEFAULT_TOP_K
+    ) -> List[Dict]:
+        """
+        Analyze a batch and extract each text's keywords from one tokenization
+        
+        The batch scorer keeps every text's token contributions while
+        scoring, and the keyword extractor ranks those, so no text is
+        tokenized twice. Result caches and the parallel executor are
+        bypassed, since keywords need the tokens of every text.
+        
+        Args:
+            texts (List[str]): Input texts to analyze
+            preprocess (str): Preprocessing mode for processed_text
+            top_k (int): Maximum number of keywords per text
+            
+        Returns:
+            List of result dictionaries as analyze_batch() returns, each
+            with an extra 'keywords' list as extract_keywords() returns
+        """
+        validate_mode(preprocess)
+        pending = [i for i, text in enumerate(texts) if text and text.strip()]
+        contributions = []
+        with timed('vader_batch'):
+            scores = self.batch_scorer.score([texts[i] for i in pending], contributions)
+        
+        results = [None] * len(texts)
+        for j, i in enumerate(pending):
+            results[i] = self._build_result(
+                self.batch_scorer.to_polarity_dict(scores, j),
+                self.pipeline.processed_text(texts[i], preprocess)
+            )
+            results[i]['keywords'] = self.keyword_extractor.rank(*contributions[j], top_k)
+        for i, result in enumerate(results):
+            if result is None:
+                results[i] = dict(self._empty_result(), keywords=[])
+        return results
+    
+    def analyze_batch_dedup(
+        self,
+        texts: List[str],
+        preprocess: str = 'none',
+        top_k: Optional[int] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """
+        Analyze a batch, scoring near-duplicate texts once
+        
+        Texts are grouped by their normalized form (see dedup.py); the first
+        text of each group is scored with analyze_batch() and its result is
+        reused for the rest of the group. Results are approximate for texts
+        that differ only in case or emoticons.
+        
+        Args:
+            texts (List[str]): Input texts to analyze
+            preprocess (str): Preprocessing mode for processed_text
+            top_k (Optional[int]): When given, representatives are scored
+                with analyze_batch_keywords() and results carry 'keywords'
+            
+        Returns:
+            Tuple of (results in input order, dedup stats with total_texts,
+            unique_texts and dedup_ratio). Results of a group are the same
+            dictionary object.
+        """
+        validate_mode(preprocess)
+        plan = plan_dedup(texts, self.pipeline.normalizer)
+        representatives = [texts[i] for i in plan.representatives]
+        if top_k is None:
+            unique_results = self.analyze_batch(representatives, preprocess)
+        else:
+            unique_results = self.analyze_batch_keywords(representatives, preprocess, top_k)
+        return [unique_results[group] for group in plan.groups], plan.stats()
+    
+    def analyze_batch_columnar(
+        self,
+        texts: Iterable[str],
+        preprocess: str = 'none',
+        chunk_size: int = COLUMNAR_CHUNK_SIZE
+    ) -> BatchResult:
+        """
+        Analyze many texts into a compact columnar BatchResult
+        
+        Texts are scored chunk by chunk with analyze_batch(), so caches and
+        the parallel executor apply, and each chunk's result dictionaries
+        are packed into typed columns before the next chunk is scored. Peak
+        memory beyond the columns is one chunk of dictionaries.
+        
+        Args:
+            texts (Iterable[str]): Input texts; may be a generator
+            preprocess (str): Preprocessing mode; processed texts are kept
+                in the result's shared text buffer unless it is 'none'
+            chunk_size (int): Texts scored per analyze_batch() call
+            
+        Returns:
+            BatchResult with one row per input text, in order
+        """
+        validate_mode(preprocess)
+        keep_text = preprocess != 'none'
+        parts = [
+            BatchResult.from_results(self.analyze_batch(chunk, preprocess), keep_text=keep_text)
+            for chunk in iter_chunks(texts, chunk_size)
+        ]
+        return BatchResult.concatenate(parts) if parts else BatchResult.from_results([], keep_text)
+    
+    def analyze_long(
+        self,
+        text: str,
+        preprocess: str = 'full',
+        chunk_chars: int = LONG_DOCUMENT_CHUNK_CHARS,
+        parallel: bool = True
+    ) -> Dict:
+        """
+        Analyze a long document in bounded chunks
         
+        The text is split at sentence ends into chunks of at most
+        chunk_chars characters (see chunking.py), the chunks are scored
+        independently and their scores are averaged weighted by chunk
+        length. Each chunk costs the same as a short analyze() call, and the
+        compound score does not saturate the way VADER's does on very long
+        text. A document that fits in one chunk scores exactly as analyze().
+        
+        Args:
+            text (str): Input document
+            preprocess (str): Preprocessing mode; processed_text is the
+                chunks' processed texts joined by spaces
+            chunk_chars (int): Longest chunk, in characters
+            parallel (bool): Score chunks on the parallel executor, if one
+                is configured and there are enough chunks
+            
+        Returns:
+            Result dictionary as returned by analyze(), plus 'chunks' (the
+            number of chunks scored)
+        """
+        validate_mode(preprocess)
+        chunks = split_chunks(text, chunk_chars)
+        if not chunks:
+            result = self._empty_result()
+            result['chunks'] = 0
+            return result
+        
+        if parallel and self.executor is not None and len(chunks) >= LONG_DOCUMENT_PARALLEL_MIN_CHUNKS:
+            # One task per worker: chunks are large, so tasks are never too small
+            per_worker = -(-len(chunks) // self.executor.workers)
+            results = self.executor.map_batch(chunks, preprocess, chunk_size=per_worker)
+        else:
+            results = self.analyze_batch(chunks, preprocess)
+        
+        if len(chunks) == 1:
+            result = dict(results[0])
+        else:
+            result = self._build_result(
+                weighted_scores(results, [len(chunk) for chunk in chunks]),
+                ' '.join(r['processed_text'] for r in results if r['processed_text'])
+            )
+        result['chunks'] = len(chunks)
+        return result
+    
+    @staticmethod
+    def _empty_result() -> Dict:
+        """Result returned for empty or whitespace-only input"""
+        return {
+            'sentiment': 'neutral',
+            'scores': {
+                'positive': 0.0,
+                'negative': 0.0,
+                'neutral': 1.0,
+                'compound': 0.0
+            },
+            'processed_text': '',
+            'confidence': 0.0
+        }
+    
+    @staticmethod
+    def _build_result(scores: Dict, processed_text: str) -> Dict:
+        """
+        Classify VADER polarity scores and build the public result dictionary
+        
+        Args:
+            scores (Dict): VADER polarity scores (pos/neg/neu/compound)
+            processed_text (str): Preprocessed text to include in the result
+            
+        Returns:
+            Result dictionary as returned by analyze()
+        """
         # Determine sentiment based on compound score
         compound = scores['compound']
         
-        if compound >= 0.05:
+        if compound >= POSITIVE_THRESHOLD:
             sentiment = 'positive'
             confidence = scores['pos']
-        elif compound <= -0.05:
+        elif compound <= NEGATIVE_THRESHOLD:
             sentiment = 'negative'
             confidence = scores['neg']
         else:
             sentiment = 'neutral'
             confidence = scores['neu']
         
-        # Preprocess the text
-        processed_text, _, _ = self.preprocess_text(text)
-        
         return {
             'sentiment': sentiment,
             'scores': {
@@ -194,7 +569,9 @@ class SentimentAnalyzer:
         """
         Analyze sentiment of individual sentences
         
-        Useful for understanding which parts of the text are positive/negative
+        Useful for understanding which parts of the text are positive/negative.
+        The text is split once and all sentences are scored in a single
+        vectorized pass, without preprocessing.
         
         Args:
             text (str): Input text containing multiple sentences
@@ -202,81 +579,132 @@ class SentimentAnalyzer:
         Returns:
             List of dictionaries containing sentence-level sentiment analysis
         """
-        sentences = sent_tokenize(text)
-        results = []
-        
-        for sentence in sentences:
-            if sentence.strip():
-                result = self.analyze(sentence)
-                results.append({
-                    'sentence': sentence,
-                    'sentiment': result['sentiment'],
-                    'scores': result['scores']
-                })
-        
-        return results
+        sentences = self.split_sentences(text)
+        return self._sentence_entries(sentences, self.analyze_batch(sentences))
     
-    def get_key_sentiments(self, text: str) -> Dict:
+    def analyze_document(self, text: str) -> Dict:
         """
-        Extract key sentiment indicators from text
+        Analyze a document and each of its sentences in one pass
         
-        Identifies words/phrases that strongly influence sentiment
+        The document and its sentences are scored together in a single
+        analyze_batch() call.
         
         Args:
-            text (str): Input text
+            text (str): Input text containing one or more sentences
             
         Returns:
-            Dict with keywords and their sentiment contributions
+            Dict containing:
+            - document: sentiment, scores and confidence of the whole text
+            - sentences: sentence-level results (index, sentence, sentiment, scores)
+            - summary: sentence counts, compound statistics and the indices
+              of the most positive and most negative sentences
         """
-        _, stemmed, lemmatized = self.preprocess_text(text)
+        sentences = self.split_sentences(text)
+        results = self.analyze_batch([text] + sentences)
+        document, sentence_results = results[0], results[1:]
         
-        positive_words = []
-        negative_words = []
+        aggregator = SentimentAggregator()
+        aggregator.add_many(sentence_results)
+        summary = aggregator.summary(percentiles=())
+        del summary['percentiles']
         
-        positive_indicators = {
-            'good', 'great', 'excellent', 'amazing', 'love', 'wonderful',
-            'fantastic', 'brilliant', 'happy', 'perfect', 'best'
-        }
+        compounds = [result['scores']['compound'] for result in sentence_results]
+        summary['most_positive_sentence'] = compounds.index(max(compounds)) if compounds else None
+        summary['most_negative_sentence'] = compounds.index(min(compounds)) if compounds else None
         
-        negative_indicators = {
-            'bad', 'terrible', 'awful', 'hate', 'horrible', 'worst',
-            'ugly', 'sad', 'poor', 'worst', 'annoying'
+        return {
+            'document': {
+                'sentiment': document['sentiment'],
+                'scores': document['scores'],
+                'confidence': document['confidence']
+            },
+            'sentences': self._sentence_entries(sentences, sentence_results),
+            'summary': summary
         }
+    
+    @staticmethod
+    def split_sentences(text: str) -> List[str]:
+        """Split text into non-empty sentences"""
+        from nltk.tokenize import sent_tokenize
         
-        for word in lemmatized:
-            if word in positive_indicators:
-                positive_words.append(word)
-            elif word in negative_indicators:
-                negative_words.append(word)
+        return [sentence for sentence in sent_tokenize(text) if sentence.strip()]
+    
+    @staticmethod
+    def _sentence_entries(sentences: List[str], results: List[Dict]) -> List[Dict]:
+        """Build sentence-level result dictionaries"""
+        return [
+            {
+                'index': i,
+                'sentence': sentence,
+                'sentiment': result['sentiment'],
+                'scores': result['scores']
+            }
+            for i, (sentence, result) in enumerate(zip(sentences, results))
+        ]
+    
+    def extract_keywords(self, text: str, top_k: int = DEFAULT_TOP_K) -> List[Dict]:
+        """
+        Return the top-k words driving the sentiment of text
+        
+        Args:
+            text (str): Input text
+            top_k (int): Maximum number of keywords to return
+            
+        Returns:
+            List of {'word', 'weight', 'count'} dicts, strongest first
+        """
+        if not text or not text.strip():
+            return []
+        with timed('keywords'):
+            return self.keyword_extractor.extract(text, top_k)
+    
+    def get_key_sentiments(self, text: str, top_k: int = DEFAULT_TOP_K) -> Dict:
+        """
+        Extract key sentiment indicators from text
+        
+        Identifies words/phrases that strongly influence sentiment
+        
+        Args:
+            text (str): Input text
+            top_k (int): Maximum number of keywords to consider
+            
+        Returns:
+            Dict with keywords and their sentiment contributions
+        """
+        keywords = self.extract_keywords(text, top_k)
+        positive_words = [k['word'] for k in keywords if k['weight'] > 0]
+        negative_words = [k['word'] for k in keywords if k['weight'] < 0]
         
         return {
-            'positive_indicators': list(set(positive_words)),
-            'negative_indicators': list(set(negative_words)),
-            'key_positive_count': len(set(positive_words)),
-            'key_negative_count': len(set(negative_words))
+            'keywords': keywords,
+            'positive_indicators': positive_words,
+            'negative_indicators': negative_words,
+            'key_positive_count': len(positive_words),
+            'key_negative_count': len(negative_words)
         }
     
-    def compare_sentiments(self, texts: List[str]) -> Dict:
+    def compare_sentiments(self, texts: List[str], dedup: bool = False) -> Dict:
         """
         Compare sentiment across multiple texts
         
         Args:
             texts (List[str]): List of texts to compare
+            dedup (bool): Score near-duplicate texts once (see
+                analyze_batch_dedup()); adds a 'dedup' stats entry
             
         Returns:
             Dict with comparative analysis
         """
-        results = []
-        total_compound = 0
-        
-        for text in texts:
-            result = self.analyze(text)
-            results.append(result)
-            total_compound += result['scores']['compound']
+        dedup_stats = None
+        if dedup:
+            results, dedup_stats = self.analyze_batch_dedup(texts, preprocess='full')
+        else:
+            results = self.analyze_batch(texts, preprocess='full')
+        total_compound = sum(result['scores']['compound'] for result in results)
         
         avg_compound = total_compound / len(texts) if texts else 0
         
-        return {
+        comparison = {
             'results': results,
             'average_compound_score': round(avg_compound, 4),
             'total_texts': len(texts),
@@ -284,3 +712,6 @@ class SentimentAnalyzer:
             'negative_count': sum(1 for r in results if r['sentiment'] == 'negative'),
             'neutral_count': sum(1 for r in results if r['sentiment'] == 'neutral')
         }
+        if dedup_stats is not None:
+            comparison['dedup'] = dedup_stats
+        return comparison
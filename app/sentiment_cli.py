@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Bulk Scoring CLI
+================
+Scores text, CSV and JSONL files (or whole directories of them) with
+SentimentAnalyzer directly, without going through the HTTP API.
+
+Records are read lazily, scored chunk by chunk with analyze_batch() and
+streamed to a CSV, JSONL or columnar NPZ output, so memory stays bounded
+by the chunk size. Progress is checkpointed after every chunk; an
+interrupted run continues where it stopped with --resume.
+
+Input formats (chosen by file extension):
+    .txt            one text per non-blank line
+    .csv            one text per row, from --text-column
+    .jsonl/.ndjson  one JSON string, or object with a --text-column field, per line
+
+Output formats (--format, or inferred from the --output extension):
+    csv, jsonl      one row per scored text
+    npz             a directory of part-NNNNN.npz files, one per chunk, with
+                    columns id, sentiment (uint8 codes into
+                    columnar.SENTIMENT_LABELS), compound, positive,
+                    negative and neutral
+
+Usage:
+    python -m sentiment_cli reviews/ --output scores.csv
+    python -m sentiment_cli data.csv --text-column review --output scores.jsonl --workers 4
+    python -m sentiment_cli corpus/ --output scores/ --format npz --resume
+    python -m sentiment_cli reviews/ --output scores.csv --cache-db scores.db
+"""
+
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import numpy as np
+from sentiment_analyzer import SentimentAnalyzer
+from preprocessing import PREPROCESS_MODES
+from parallel import ParallelExecutor
+from persistent_cache import PersistentCache
+from aggregation import SentimentAggregator
+from streaming import iter_chunks
+from columnar import BatchResult
+
+
+INPUT_EXTENSIONS = {'.txt': 'text', '.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+OUTPUT_FORMATS = ('csv', 'jsonl', 'npz')
+
+CHECKPOINT_VERSION = 1
+
+# Largest CSV field accepted (the csv module default is 128KB)
+MAX_CSV_FIELD_SIZE = 16 * 1024 * 1024
+
+
+def find_inputs(paths: List[str]) -> List[str]:
+    """
+    Expand files and directories into a sorted list of input files
+
+    Directories are walked recursively for files with a supported extension.
+
+    Raises:
+        ValueError: If a path does not exist or has an unsupported extension
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                for name in sorted(names):
+                    if os.path.splitext(name)[1].lower() in INPUT_EXTENSIONS:
+                        files.append(os.path.join(root, name))
+        elif os.path.isfile(path):
+            if os.path.splitext(path)[1].lower() not in INPUT_EXTENSIONS:
+                raise ValueError(f'Unsupported input file type: {path}')
+            files.append(path)
+        else:
+            raise ValueError(f'No such file or directory: {path}')
+    return files
+
+
+def iter_file_records(path: str, text_column: str = 'text', id_column: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (record id, text) pairs from one input file
+
+    Record ids default to ``<path>:<line or row number>``; for CSV and JSONL
+    inputs they are taken from id_column when it is present. Blank texts are
+    skipped.
+    """
+    kind = INPUT_EXTENSIONS[os.path.splitext(path)[1].lower()]
+
+    with open(path, encoding='utf-8', errors='replace', newline='' if kind == 'csv' else None) as f:
+        if kind == 'csv':
+            reader = csv.DictReader(f)
+            if text_column not in (reader.fieldnames or []):
+                raise ValueError(f'{path} has no "{text_column}" column')
+            for row_number, row in enumerate(reader, start=1):
+                text = (row.get(text_column) or '').strip()
+                if text:
+                    record_id = row.get(id_column) if id_column else None
+                    yield record_id or f'{path}:{row_number}', text
+            return
+
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            record_id = None
+            if kind == 'jsonl':
+                try:
+                    value = json.loads(line)
+                except ValueError:
+                    raise ValueError(f'{path}:{line_number}: invalid JSON')
+                if isinstance(value, dict):
+                    if id_column and value.get(id_column) is not None:
+                        record_id = str(value[id_column])
+                    value = value.get(text_column)
+                if not isinstance(value, str):
+                    continue
+                line = value.strip()
+                if not line:
+                    continue
+            yield record_id or f'{path}:{line_number}', line
+
+
+def iter_records(files: List[str], text_column: str = 'text', id_column: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    """Yield (record id, text) pairs from all input files in order"""
+    for path in files:
+        yield from iter_file_records(path, text_column, id_column)
+
+
+class OutputWriter:
+    """Appends scored chunks to a CSV, JSONL or NPZ output"""
+
+    def __init__(self, path: str, fmt: str, include_processed: bool = False):
+        """
+        Args:
+            path (str): Output file (csv/jsonl) or directory (npz)
+            fmt (str): One of OUTPUT_FORMATS
+            include_processed (bool): Add a processed_text column
+        """
+        self.path = path
+        self.format = fmt
+        self.columns = ['id', 'sentiment', 'compound', 'positive', 'negative', 'neutral']
+        if include_processed:
+            self.columns.append('processed_text')
+        self.parts = 0
+        self._file = None
+
+    def open(self, position: Optional[Dict] = None) -> None:
+        """
+        Open the output, truncating it back to a checkpointed position
+
+        Args:
+            position (Dict): Value of position() saved in a checkpoint;
+                None starts a fresh output
+        """
+        if self.format == 'npz':
+            os.makedirs(self.path, exist_ok=True)
+            self.parts = position['parts'] if position else 0
+            # Drop parts written after the checkpoint
+            for name in os.listdir(self.path):
+                if name.startswith('part-') and name.endswith('.npz') and int(name[5:-4]) >= self.parts:
+                    os.remove(os.path.join(self.path, name))
+            return
+
+        if position:
+            self._file = open(self.path, 'r+', encoding='utf-8', newline='')
+            self._file.seek(position['offset'])
+            self._file.truncate()
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8', newline='')
+            if self.format == 'csv':
+                csv.writer(self._file).writerow(self.columns)
+
+    def write(self, ids: List[str], results: List[Dict]) -> None:
+        """Append one scored chunk and flush it to disk"""
+        if self.format == 'npz':
+            self._write_part(ids, results)
+            return
+
+        rows = [self._row(record_id, result) for record_id, result in zip(ids, results)]
+        if self.format == 'csv':
+            csv.writer(self._file).writerows(rows)
+        else:
+            for row in rows:
+                self._file.write(json.dumps(dict(zip(self.columns, row))) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _row(self, record_id: str, result: Dict) -> List:
+        scores = result['scores']
+        row = [
+            record_id, result['sentiment'], scores['compound'],
+            scores['positive'], scores['negative'], scores['neutral']
+        ]
+        if 'processed_text' in self.columns:
+            row.append(result['processed_text'])
+        return row
+
+    def _write_part(self, ids: List[str], results: List[Dict]) -> None:
+        # Sentiment codes index columnar.SENTIMENT_LABELS
+        batch = BatchResult.from_results(results)
+        columns = {'id': np.array(ids, dtype=str), 'sentiment': batch.sentiment}
+        for name in ('compound', 'positive', 'negative', 'neutral'):
+            columns[name] = getattr(batch, name)
+        if 'processed_text' in self.columns:
+            columns['processed_text'] = np.array([result['processed_text'] for result in results], dtype=str)
+
+        final = os.path.join(self.path, f'part-{self.parts:05d}.npz')
+        temp = final + '.tmp'
+        with open(temp, 'wb') as f:
+            np.savez(f, **columns)
+        os.replace(temp, final)
+        self.parts += 1
+
+    def position(self) -> Dict:
+        """Return the current output position for a checkpoint"""
+        if self.format == 'npz':
+            return {'parts': self.parts}
+        return {'offset': self._file.tell()}
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class Checkpoint:
+    """
+    Progress file for resumable runs
+
+    Records how many input records have been scored and where the output
+    ended at that point. It is rewritten atomically after every chunk.
+    """
+
+    def __init__(self, path: str, inputs: List[str], output: str):
+        self.path = path
+        self.inputs = inputs
+        self.output = output
+
+    def load(self) -> Optional[Dict]:
+        """
+        Return the saved state, or None if there is no checkpoint
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different run
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path) as f:
+            state = json.load(f)
+        if (
+            state.get('version') != CHECKPOINT_VERSION
+            or state.get('inputs') != self.inputs
+            or state.get('output') != self.output
+        ):
+            raise ValueError(f'Checkpoint {self.path} was written for different inputs or output')
+        return state
+
+    def save(self, records: int, position: Dict) -> None:
+        state = {
+            'version': CHECKPOINT_VERSION,
+            'inputs': self.inputs,
+            'output': self.output,
+            'records': records,
+            'position': position
+        }
+        temp = self.path + '.tmp'
+        with open(temp, 'w') as f:
+            json.dump(state, f)
+        os.replace(temp, self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def run(args: argparse.Namespace) -> int:
+    files = find_inputs(args.inputs)
+    if not files:
+        print('No input files found', file=sys.stderr)
+        return 1
+
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip('.').lower()
+    if fmt not in OUTPUT_FORMATS:
+        print(f"Output format must be one of: {', '.join(OUTPUT_FORMATS)}", file=sys.stderr)
+        return 2
+
+    checkpoint = Checkpoint(
+        args.checkpoint or os.path.normpath(args.output) + '.checkpoint',
+        [os.path.abspath(path) for path in files],
+        os.path.abspath(args.output)
+    )
+    state = checkpoint.load() if args.resume else None
+    done = state['records'] if state else 0
+
+    executor = ParallelExecutor(
+        workers=args.workers,
+        chunk_size=max(1, args.chunk_size // args.workers),
+        min_items=1,
+        analyzer_options={'snapshot': args.snapshot, 'lexicon_path': args.lexicon},
+        preload=args.preprocess
+    ) if args.workers > 1 else None
+    analyzer = SentimentAnalyzer(
+        executor=executor,
+        snapshot=args.snapshot,
+        lexicon_path=args.lexicon,
+        persistent_cache=PersistentCache(args.cache_db) if args.cache_db else None
+    )
+
+    writer = OutputWriter(args.output, fmt, include_processed=args.preprocess != 'none')
+    writer.open(state['position'] if state else None)
+
+    aggregator = SentimentAggregator()
+    records = islice(iter_records(files, args.text_column, args.id_column), done, None)
+    scored = 0
+    start = last_report = time.perf_counter()
+
+    if done:
+        print(f'Resuming after {done} records', file=sys.stderr)
+
+    try:
+        for chunk in iter_chunks(records, args.chunk_size):
+            ids = [record_id for record_id, _ in chunk]
+            results = analyzer.analyze_batch([text for _, text in chunk], preprocess=args.preprocess)
+            writer.write(ids, results)
+            aggregator.add_many(results)
+            scored += len(chunk)
+            checkpoint.save(done + scored, writer.position())
+
+            now = time.perf_counter()
+            if now - last_report >= args.progress_every:
+                print(f'{done + scored:>10} records  {scored / (now - start):>10.1f} records/s', file=sys.stderr)
+                last_report = now
+    except KeyboardInterrupt:
+        print(f'Interrupted after {done + scored} records; rerun with --resume to continue', file=sys.stderr)
+        return 130
+    finally:
+        writer.close()
+        if executor is not None:
+            executor.shutdown()
+
+    checkpoint.remove()
+    elapsed = time.perf_counter() - start
+    summary = aggregator.summary()
+    print(
+        f'Scored {scored} records from {len(files)} file(s) in {elapsed:.2f}s '
+        f'({scored / elapsed if elapsed else 0.0:.1f} records/s)',
+        file=sys.stderr
+    )
+    print(
+        f"positive {summary['positive_count']}  negative {summary['negative_count']}  "
+        f"neutral {summary['neutral_count']}  mean compound {summary['average_compound_score']}",
+        file=sys.stderr
+    )
+    if analyzer.persistent_cache is not None:
+        cache_stats = analyzer.persistent_cache.stats()
+        print(f"cache hits {cache_stats['hits']}  misses {cache_stats['misses']}", file=sys.stderr)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m sentiment_cli',
+        description='Score text, CSV and JSONL files with the sentiment analyzer'
+    )
+    parser.add_argument('inputs', nargs='+', help='input files or directories')
+    parser.add_argument('--output', '-o', required=True, help='output file (csv/jsonl) or directory (npz)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, help='output format (default: from --output extension)')
+    parser.add_argument('--text-column', default='text', help='CSV column / JSON field holding the text')
+    parser.add_argument('--id-column', help='CSV column / JSON field holding a record id')
+    parser.add_argument('--preprocess', default='none', choices=PREPROCESS_MODES)
+    parser.add_argument('--chunk-size', type=int, default=1000, help='texts scored and written per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='worker processes for scoring')
+    parser.add_argument('--resume', action='store_true', help='continue from the checkpoint of an interrupted run')
+    parser.add_argument('--checkpoint', help='checkpoint file (default: <output>.checkpoint)')
+    parser.add_argument('--snapshot', help='resources.py snapshot to load')
+    parser.add_argument('--lexicon', help='resources.py lexicon store to memory-map')
+    parser.add_argument('--cache-db', help='persistent SQLite score cache shared across runs')
+    parser.add_argument('--progress-every', type=float, default=5.0, help='seconds between progress lines')
+    args = parser.parse_args(argv)
+
+    if args.chunk_size <= 0 or args.workers <= 0:
+        parser.error('--chunk-size and --workers must be positive')
+
+    csv.field_size_limit(MAX_CSV_FIELD_SIZE)
+    try:
+        return run(args)
+    except ValueError as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+Incremental Sessions Module
+===========================
+Session-based sentiment for text that grows by appending (live chat,
+transcripts).
+
+Each session keeps only a small amount of state: the trailing partial
+sentence not yet scored, a constant-memory aggregator over all scored
+sentences and a rolling window of recent compound scores. Appending text
+splits and scores only the new sentences, so an update costs time
+proportional to the appended text rather than the whole conversation.
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional
+import threading
+import time
+import uuid
+from aggregation import SentimentAggregator
+from sentiment_analyzer import NEGATIVE_THRESHOLD, POSITIVE_THRESHOLD
+
+
+DEFAULT_WINDOW = 20
+
+# Longest partial sentence held back; longer carries are scored as-is
+MAX_CARRY_CHARS = 5000
+
+SENTENCE_ENDINGS = ('.', '!', '?', '\n')
+
+
+class RollingWindow:
+    """
+    Mean and least-squares slope of the last ``size`` compound scores
+
+    Sums are updated as scores enter and leave the window, so each update
+    is O(1). The slope is in compound units per sentence.
+    """
+
+    def __init__(self, size: int = DEFAULT_WINDOW):
+        self.size = size
+        self._values = deque()
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._next_x = 0
+
+    def add(self, value: float) -> None:
+        x = self._next_x
+        self._next_x += 1
+        self._values.append(value)
+        self._sum_y += value
+        self._sum_xy += x * value
+        if len(self._values) > self.size:
+            old = self._values.popleft()
+            old_x = x - self.size
+            self._sum_y -= old
+            self._sum_xy -= old_x * old
+
+    @property
+    def mean(self) -> float:
+        return self._sum_y / len(self._values) if self._values else 0.0
+
+    @property
+    def slope(self) -> float:
+        n = len(self._values)
+        if n < 2:
+            return 0.0
+        # x runs over the consecutive indices first..first+n-1; for those,
+        # n * sum(x^2) - sum(x)^2 reduces to n^2 (n^2 - 1) / 12
+        first = self._next_x - n
+        sum_x = n * first + n * (n - 1) / 2
+        denominator = n * n * (n * n - 1) / 12
+        return (n * self._sum_xy - sum_x * self._sum_y) / denominator
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class Session:
+    """State of one incremental analysis session"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.id = uuid.uuid4().hex
+        self.carry = ''
+        self.sentences = 0
+        self.aggregator = SentimentAggregator()
+        self.window = RollingWindow(window)
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+        self.lock = threading.Lock()
+
+    def to_dict(self) -> Dict:
+        """Describe the session's running aggregates"""
+        rolling_mean = self.window.mean
+        if not len(self.window):
+            rolling_sentiment = None
+        elif rolling_mean >= POSITIVE_THRESHOLD:
+            rolling_sentiment = 'positive'
+        elif rolling_mean <= NEGATIVE_THRESHOLD:
+            rolling_sentiment = 'negative'
+        else:
+            rolling_sentiment = 'neutral'
+
+        summary = self.aggregator.summary(percentiles=())
+        del summary['percentiles']
+        return {
+            'session_id': self.id,
+            'sentences': self.sentences,
+            'pending_text': self.carry,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'summary': summary,
+            'rolling': {
+                'window': self.window.size,
+                'size': len(self.window),
+                'average_compound_score': round(rolling_mean, 4),
+                'trend': round(self.window.slope, 4),
+                'sentiment': rolling_sentiment
+            }
+        }
+
+
+class SessionStore:
+    """
+    Bounded in-memory session registry
+
+    Sessions idle for longer than ``ttl`` seconds are dropped, and the least
+    recently updated session is evicted when ``max_sessions`` is reached.
+    """
+
+    def __init__(self, analyzer, max_sessions: int = 1000, ttl: Optional[float] = 3600):
+        """
+        Args:
+            analyzer: SentimentAnalyzer used to score sentences
+            max_sessions (int): Maximum number of live sessions
+            ttl (float): Idle seconds before a session expires; None keeps
+                sessions until evicted
+        """
+        self.analyzer = analyzer
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, window: int = DEFAULT_WINDOW) -> Session:
+        session = Session(window)
+        with self._lock:
+            self._expire()
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id: str) -> Optional[Session]:
+        """Return a live session, or None if unknown or expired"""
+        with self._lock:
+            self._expire()
+            return self._sessions.get(session_id)
+
+    def delete(self, session_id: str) -> Optional[Session]:
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    def append(self, session: Session, text: str, flush: bool = False) -> List[Dict]:
+        """
+        Append text to a session and score its newly completed sentences
+
+        The trailing sentence is held back until it is terminated by
+        sentence-ending punctuation or a newline, since later text may
+        continue it.
+
+        Args:
+            session (Session): Session to update
+            text (str): Appended text
+            flush (bool): Score the trailing partial sentence too
+
+        Returns:
+            List of sentence entries ({'index', 'sentence', 'sentiment',
+            'scores'}) with session-wide indices
+        """
+        with session.lock:
+            buffer = session.carry + text
+            sentences = self.analyzer.split_sentences(buffer)
+            carry = ''
+            if sentences and not flush and not buffer.rstrip(' \t').endswith(SENTENCE_ENDINGS):
+                last = sentences.pop()
+                # Keep the raw suffix so whitespace before the next append survives
+                carry = buffer[buffer.rfind(last):]
+                if len(carry) > MAX_CARRY_CHARS:
+                    sentences.append(last)
+                    carry = ''
+
+            results = self.analyzer.analyze_batch(sentences)
+            session.aggregator.add_many(results)
+            entries = []
+            for sentence, result in zip(sentences, results):
+                session.window.add(result['scores']['compound'])
+                entries.append({
+                    'index': session.sentences,
+                    'sentence': sentence,
+                    'sentiment': result['sentiment'],
+                    'scores': result['scores']
+                })
+                session.sentences += 1
+
+            session.carry = carry
+            session.updated_at = time.time()
+
+        with self._lock:
+            if session.id in self._sessions:
+                self._sessions.move_to_end(session.id)
+        return entries
+
+    def stats(self) -> Dict:
+        with self._lock:
+            self._expire()
+            return {'sessions': len(self._sessions), 'max_sessions': self.max_sessions}
+
+    def _expire(self) -> None:
+        if self.ttl is None:
+            return
+        cutoff = time.time() - self.ttl
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.updated_at > cutoff:
+                break
+            self._sessions.popitem(last=False)
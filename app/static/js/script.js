@@ -6,7 +6,9 @@
 
 // Global variables
 let currentChart = null;
-const MAX_CHARACTERS = 5000;
+// Limits are rendered by the server from its configuration
+const MAX_CHARACTERS = Number(document.body.dataset.maxCharacters) || 5000;
+const MAX_BATCH_TEXTS = Number(document.body.dataset.maxBatchTexts) || 50;
 
 // ==================== DOM Element Initialization ====================
 
@@ -164,7 +166,9 @@ async function handleFileSelect(file) {
 
     if (data.success) {
       displaySingleResult(data);
-      showUploadSuccess(`File "${file.name}" analyzed successfully`);
+      // Long files come back with previews of their text only
+      const note = data.truncated ? " (preview shown)" : "";
+      showUploadSuccess(`File "${file.name}" analyzed successfully${note}`);
     } else {
       showUploadError(data.message);
     }
@@ -213,8 +217,8 @@ async function batchAnalyze() {
     return;
   }
 
-  if (texts.length > 50) {
-    showError("Maximum 50 texts can be analyzed at once");
+  if (texts.length > MAX_BATCH_TEXTS) {
+    showError(`Maximum ${MAX_BATCH_TEXTS} texts can be analyzed at once`);
     return;
   }
 
@@ -0,0 +1,267 @@
+"""
+Streaming Analysis Module
+=========================
+Generator pipeline for scoring arbitrarily large text streams.
+
+Input is read incrementally, split into lines or sentences, grouped into
+chunks and scored with SentimentAnalyzer.analyze_batch(). Output is a
+sequence of NDJSON records (one per chunk, then a summary), so memory use
+is bounded by the chunk size rather than the input size.
+"""
+
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Tuple
+import io
+import json
+from aggregation import SentimentAggregator
+
+
+SPLIT_MODES = ('line', 'sentence')
+
+# Longest segment read at once; longer lines are scored in pieces
+MAX_SEGMENT_CHARS = 5000
+
+# Longest NDJSON input record; longer records are rejected
+MAX_RECORD_CHARS = 1000000
+
+
+def iter_lines(stream: BinaryIO, encoding: str = 'utf-8', max_chars: int = MAX_SEGMENT_CHARS) -> Iterator[str]:
+    """
+    Decode a binary stream and yield its lines without reading it whole
+
+    Args:
+        stream (BinaryIO): Binary file-like object
+        encoding (str): Text encoding; undecodable bytes are dropped
+        max_chars (int): Longest line yielded; longer lines are split
+
+    Yields:
+        str: Lines without trailing newlines
+    """
+    text_stream = io.TextIOWrapper(stream, encoding=encoding, errors='ignore')
+    try:
+        for line in iter(lambda: text_stream.readline(max_chars), ''):
+            yield line.rstrip('\r\n')
+    finally:
+        # Leave the underlying stream open for its owner
+        text_stream.detach()
+
+
+def close_after(records: Iterable[str], stream) -> Iterator[str]:
+    """Yield from records, closing stream once they are exhausted or abandoned"""
+    try:
+        yield from records
+    finally:
+        stream.close()
+
+
+def iter_segments(lines: Iterable[str], split: str = 'line') -> Iterator[str]:
+    """
+    Yield non-empty text segments to score
+
+    Args:
+        lines (Iterable[str]): Input lines
+        split (str): 'line' to score each line, 'sentence' to split lines
+            into sentences first
+
+    Yields:
+        str: Stripped, non-empty segments
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if split == 'sentence':
+            from nltk.tokenize import sent_tokenize
+            for sentence in sent_tokenize(line):
+                if sentence.strip():
+                    yield sentence.strip()
+        else:
+            yield line
+
+
+def iter_chunks(items: Iterable, size: int) -> Iterator[List]:
+    """Group an iterable into lists of at most size items"""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_scored_chunks(analyzer, segments: Iterable[str], chunk_size: int = 500) -> Iterator[Tuple[List[str], List[Dict]]]:
+    """
+    Score segments chunk by chunk
+
+    Yields:
+        Tuple of (chunk texts, analyze()-style results)
+    """
+    for chunk in iter_chunks(segments, chunk_size):
+        yield chunk, analyzer.analyze_batch(chunk)
+
+
+def stream_analysis(analyzer, segments: Iterable[str], chunk_size: int = 500) -> Iterator[str]:
+    """
+    Score segments and yield NDJSON records
+
+    Emits one ``{"type": "chunk", ...}`` record per scored chunk followed by
+    a ``{"type": "summary", ...}`` record with aggregate statistics. Errors
+    raised mid-stream are reported as a final ``{"type": "error"}`` record.
+
+    Args:
+        analyzer: SentimentAnalyzer instance
+        segments (Iterable[str]): Texts to score, consumed lazily
+        chunk_size (int): Segments scored per chunk
+
+    Yields:
+        str: Newline-terminated JSON records
+    """
+    aggregator = SentimentAggregator()
+    position = 0
+    chunk_index = 0
+
+    try:
+        for chunk, results in iter_scored_chunks(analyzer, segments, chunk_size):
+            aggregator.add_many(results)
+            yield json.dumps({
+                'type': 'chunk',
+                'chunk': chunk_index,
+                'results': [
+                    {
+                        'index': position + i,
+                        'sentiment': result['sentiment'],
+                        'scores': result['scores']
+                    }
+                    for i, result in enumerate(results)
+                ]
+            }) + '\n'
+            position += len(chunk)
+            chunk_index += 1
+    except Exception as e:
+        yield json.dumps({
+            'type': 'error',
+            'message': f'Error during streaming analysis: {str(e)}'
+        }) + '\n'
+        return
+
+    summary = aggregator.summary()
+    summary['type'] = 'summary'
+    summary['chunks'] = chunk_index
+    yield json.dumps(summary) + '\n'
+
+
+def iter_records(lines: Iterable[str], max_chars: int = MAX_RECORD_CHARS) -> Iterator[Dict]:
+    """
+    Parse NDJSON batch input
+
+    Each non-blank line is either a JSON string or an object with a
+    ``text`` field and an optional ``id`` that is echoed back. ``lines``
+    must come from ``iter_lines(stream, max_chars=max_chars + 1)`` so that
+    overlong records can be detected and skipped whole.
+
+    Yields:
+        Dict with 'index' and either 'text' (and 'id' if given) or 'error'
+    """
+    index = 0
+    overlong = False
+    for line in lines:
+        if overlong:
+            # Remainder of a record that was already rejected
+            overlong = len(line) > max_chars
+            continue
+        if len(line) > max_chars:
+            overlong = True
+            yield {'index': index, 'error': f'Record is longer than {max_chars} characters'}
+            index += 1
+            continue
+        if not line.strip():
+            continue
+
+        record = {'index': index}
+        index += 1
+        try:
+            value = json.loads(line)
+        except ValueError:
+            record['error'] = 'Invalid JSON'
+            yield record
+            continue
+
+        if isinstance(value, dict):
+            if 'id' in value:
+                record['id'] = value['id']
+            value = value.get('text')
+        if not isinstance(value, str):
+            record['error'] = 'Record must be a string or an object with a "text" string'
+        elif not value.strip():
+            record['error'] = 'Text cannot be empty'
+        else:
+            record['text'] = value.strip()
+        yield record
+
+
+def stream_batch(
+    analyzer,
+    records: Iterable[Dict],
+    chunk_size: int = 50,
+    preprocess: str = 'none'
+) -> Iterator[str]:
+    """
+    Score parsed NDJSON records and yield one NDJSON line per record
+
+    Records are scored in small chunks with analyze_batch(), so results
+    start flowing after the first chunk and memory stays bounded by the
+    chunk size. Output is in input order: ``{"type": "result", ...}`` for
+    scored texts, ``{"type": "error", "index": ...}`` for rejected records,
+    then a final ``{"type": "summary", ...}`` record.
+
+    Args:
+        analyzer: SentimentAnalyzer instance
+        records (Iterable[Dict]): Output of iter_records(), consumed lazily
+        chunk_size (int): Records scored per analyze_batch() call
+        preprocess (str): Preprocessing mode; processed_text is included
+            unless this is 'none'
+
+    Yields:
+        str: Newline-terminated JSON records
+    """
+    aggregator = SentimentAggregator()
+    errors = 0
+
+    try:
+        for chunk in iter_chunks(records, chunk_size):
+            valid = [record for record in chunk if 'error' not in record]
+            batch = analyzer.analyze_batch([record['text'] for record in valid], preprocess=preprocess)
+            aggregator.add_many(batch)
+            results = iter(batch)
+            for record in chunk:
+                if 'error' in record:
+                    errors += 1
+                    yield json.dumps(_output_record('error', record, message=record['error'])) + '\n'
+                    continue
+                result = next(results)
+                output = _output_record(
+                    'result', record, sentiment=result['sentiment'], scores=result['scores']
+                )
+                if preprocess != 'none':
+                    output['processed_text'] = result['processed_text']
+                yield json.dumps(output) + '\n'
+    except Exception as e:
+        yield json.dumps({
+            'type': 'error',
+            'message': f'Error during batch streaming: {str(e)}'
+        }) + '\n'
+        return
+
+    summary = aggregator.summary()
+    summary['type'] = 'summary'
+    summary['errors'] = errors
+    yield json.dumps(summary) + '\n'
+
+
+def _output_record(record_type: str, record: Dict, **fields) -> Dict:
+    output = {'type': record_type, 'index': record['index']}
+    if 'id' in record:
+        output['id'] = record['id']
+    output.update(fields)
+    return output
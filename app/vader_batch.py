@@ -0,0 +1,343 @@
+"""
+Vectorized VADER Batch Scorer
+=============================
+Scores many texts in one call using NumPy array operations.
+
+VADER's per-call cost is dominated by Python overhead: building a ``SentiText``
+object, running the rule engine for every token and summing scores in plain
+Python loops. This module tokenizes each text once, resolves lexicon hits
+through a precomputed vocabulary index whose valence array supplies each
+hit's base valence, runs VADER's contextual rules only for tokens that
+actually carry a valence, and computes pos/neg/neu/compound for the whole
+batch with array operations.
+
+Scores are identical to ``SentimentIntensityAnalyzer.polarity_scores``.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+
+
+class LexiconIndex:
+    """
+    Precomputed vocabulary index over the VADER lexicon
+
+    Words are stored in sorted order so that an id is stable for a given
+    lexicon; valences live in a contiguous NumPy array indexed by id.
+    """
+
+    def __init__(self, lexicon: Dict[str, float]):
+        """
+        Build the index from a VADER lexicon dictionary
+
+        Args:
+            lexicon (Dict[str, float]): Mapping of lowercase word to valence
+        """
+        self.words = sorted(lexicon)
+        self.ids = {word: idx for idx, word in enumerate(self.words)}
+        self.valences = np.array([lexicon[word] for word in self.words], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def index_of(self, word: str) -> int:
+        """Return the vocabulary id of a lowercase word, or -1 if absent"""
+        return self.ids.get(word, -1)
+
+    def valence(self, idx: int) -> float:
+        """Return the valence stored at a vocabulary id"""
+        return float(self.valences[idx])
+
+
+class BatchScores(NamedTuple):
+    """Raw VADER scores for a batch, one array element per input text"""
+    pos: np.ndarray
+    neg: np.ndarray
+    neu: np.ndarray
+    compound: np.ndarray
+
+
+class VaderBatchScorer:
+    """
+    Batch front-end for an NLTK ``SentimentIntensityAnalyzer``
+
+    Base valences come from the index; the analyzer's negation, idiom and
+    "least" rule methods are reused as-is.
+    """
+
+    def __init__(self, sia, index: LexiconIndex = None):
+        """
+        Args:
+            sia: NLTK SentimentIntensityAnalyzer instance
+            index: Prebuilt LexiconIndex or lexicon_store.MappedLexicon;
+                a LexiconIndex is built from ``sia.lexicon`` if omitted
+        """
+        self.sia = sia
+        self.constants = sia.constants
+        self.index = index if index is not None else LexiconIndex(sia.lexicon)
+        self._punc_list = self.constants.PUNC_LIST
+        self._punc_chars = set(''.join(self._punc_list))
+        self._remove_punctuation = self.constants.REGEX_REMOVE_PUNCTUATION
+        self._boosters = self.constants.BOOSTER_DICT
+
+    def tokenize(self, text: str) -> Tuple[List[str], bool]:
+        """
+        Split text into VADER tokens
+
+        Equivalent to ``SentiText.words_and_emoticons`` but avoids building
+        the punctuation/word cross-product dictionary for every call.
+
+        Args:
+            text (str): Raw input text
+
+        Returns:
+            Tuple of (tokens, is_cap_diff)
+        """
+        words_only = {
+            w for w in self._remove_punctuation.sub('', text).split() if len(w) > 1
+        }
+        punc_chars = self._punc_chars
+        tokens = []
+        allcaps = 0
+        for we in text.split():
+            if len(we) <= 1:
+                continue
+            if we[0] in punc_chars or we[-1] in punc_chars:
+                we = self._strip_punctuation(we, words_only)
+            if we.isupper():
+                allcaps += 1
+            tokens.append(we)
+        is_cap_diff = 0 < len(tokens) - allcaps < len(tokens)
+        return tokens, is_cap_diff
+
+    def _strip_punctuation(self, we: str, words_only: set) -> str:
+        """Remove one leading or trailing VADER punctuation run from a token"""
+        for punc in self._punc_list:
+            if we.endswith(punc) and we[:-len(punc)] in words_only:
+                return we[:-len(punc)]
+        for punc in self._punc_list:
+            if we.startswith(punc) and we[len(punc):] in words_only:
+                return we[len(punc):]
+        return we
+
+    def token_sentiments(self, tokens: List[str], is_cap_diff: bool) -> List[float]:
+        """
+        Compute VADER's per-token valences before the "but" adjustment
+
+        Only tokens found in the lexicon index are passed through the rule
+        engine; every other token contributes zero, exactly as in VADER.
+        """
+        first_index = {}
+        sentiments = []
+        for pos, item in enumerate(tokens):
+            first_index.setdefault(item, pos)
+        for item in tokens:
+            if not self.is_lexicon_hit(item):
+                sentiments.append(0)
+                continue
+            # VADER resolves repeated tokens to their first occurrence
+            sentiments.append(self.valence_at(tokens, is_cap_diff, first_index[item]))
+        return sentiments
+
+    def is_lexicon_hit(self, token: str) -> bool:
+        """Return True if VADER's rules score token (a lexicon word, not a booster)"""
+        token_lowercase = token.lower()
+        return self.index.index_of(token_lowercase) >= 0 and token_lowercase not in self._boosters
+
+    def valence_at(self, tokens: List[str], is_cap_diff: bool, i: int) -> float:
+        """
+        Compute the valence of the token at position i in its context
+
+        The rules read at most three tokens before and two after position i.
+
+        Returns:
+            float: Valence before the "but" adjustment; 0 for tokens that
+            are not lexicon hits
+        """
+        item = tokens[i]
+        item_lowercase = item.lower()
+        idx = self.index.index_of(item_lowercase)
+        if idx < 0 or item_lowercase in self._boosters:
+            return 0
+        if (
+            item_lowercase == 'kind'
+            and i < len(tokens) - 1
+            and tokens[i + 1].lower() == 'of'
+        ):
+            return 0
+        return self._apply_rules(self.index.valence(idx), tokens, is_cap_diff, item, i)
+
+    def _apply_rules(self, valence: float, tokens: List[str], is_cap_diff: bool, item: str, i: int) -> float:
+        """
+        Apply VADER's contextual rules to a token's base valence
+
+        Mirrors ``SentimentIntensityAnalyzer.sentiment_valence`` (capitals,
+        preceding boosters, negation, idioms, "least"), but takes the base
+        valence from the index instead of the analyzer's lexicon dict.
+        """
+        sia = self.sia
+        constants = self.constants
+        index_of = self.index.index_of
+        if item.isupper() and is_cap_diff:
+            if valence > 0:
+                valence += constants.C_INCR
+            else:
+                valence -= constants.C_INCR
+
+        for start_i in range(0, 3):
+            if i > start_i and index_of(tokens[i - (start_i + 1)].lower()) < 0:
+                # Dampen preceding modifiers by their distance from the item
+                s = constants.scalar_inc_dec(tokens[i - (start_i + 1)], valence, is_cap_diff)
+                if start_i == 1 and s != 0:
+                    s = s * 0.95
+                if start_i == 2 and s != 0:
+                    s = s * 0.9
+                valence = valence + s
+                valence = sia._never_check(valence, tokens, start_i, i)
+                if start_i == 2:
+                    valence = sia._idioms_check(valence, tokens, i)
+
+        return sia._least_check(valence, tokens, i)
+
+    @staticmethod
+    def but_index(tokens: List[str]) -> int:
+        """Return the position of the first "but" token, or -1"""
+        for pos, token in enumerate(tokens):
+            if token.lower() == 'but':
+                return pos
+        return -1
+
+    @staticmethod
+    def apply_but(sentiments: List[float], bi: int) -> List[float]:
+        """Apply VADER's "but" rule around position bi (no-op if bi < 0)"""
+        if bi < 0:
+            return sentiments
+        return [
+            s * 0.5 if pos < bi else s * 1.5 if pos > bi else s
+            for pos, s in enumerate(sentiments)
+        ]
+
+    def token_contributions(self, text: str) -> Tuple[List[str], List[float]]:
+        """
+        Tokenize text once and return each token's final valence
+
+        The "but" rule is applied, so the values are exactly what VADER
+        sums for the text's compound score.
+        """
+        tokens, is_cap_diff = self.tokenize(text)
+        sentiments = self.token_sentiments(tokens, is_cap_diff)
+        return tokens, self.apply_but(sentiments, self.but_index(tokens))
+
+    def score(
+        self,
+        texts: Sequence[str],
+        contributions: Optional[List[Tuple[List[str], List[float]]]] = None
+    ) -> BatchScores:
+        """
+        Score a batch of texts
+
+        Args:
+            texts (Sequence[str]): Raw input texts
+            contributions (list): If given, each text's (tokens, final
+                valences) pair, as token_contributions() returns it, is
+                appended here, so callers can reuse the tokenization
+
+        Returns:
+            BatchScores with unrounded float64 arrays
+        """
+        flat = []
+        text_ids = []
+        but_factors = []
+        for text_id, text in enumerate(texts):
+            tokens, is_cap_diff = self.tokenize(text)
+            sentiments = self.token_sentiments(tokens, is_cap_diff)
+            flat.extend(sentiments)
+            text_ids.extend([text_id] * len(sentiments))
+            bi = self.but_index(tokens)
+            if bi >= 0:
+                but_factors.append((len(flat) - len(sentiments), bi, len(sentiments)))
+            if contributions is not None:
+                contributions.append((tokens, self.apply_but(sentiments, bi)))
+
+        return self.score_sentiments(
+            np.asarray(flat, dtype=np.float64),
+            np.asarray(text_ids, dtype=np.intp),
+            texts,
+            but_factors,
+        )
+
+    def score_sentiments(
+        self,
+        sentiments: np.ndarray,
+        text_ids: np.ndarray,
+        texts: Sequence[str],
+        but_factors: List[Tuple[int, int, int]] = (),
+    ) -> BatchScores:
+        """
+        Aggregate flattened per-token valences into per-text VADER scores
+
+        Args:
+            sentiments (np.ndarray): Token valences for all texts, concatenated
+            text_ids (np.ndarray): Owning text index for every token
+            texts (Sequence[str]): Original texts, used for punctuation emphasis
+            but_factors: (start, but_position, length) triples for texts with "but"
+
+        Returns:
+            BatchScores with unrounded float64 arrays
+        """
+        n = len(texts)
+        sentiments = sentiments.copy()
+        for start, bi, length in but_factors:
+            segment = sentiments[start:start + length]
+            segment[:bi] *= 0.5
+            segment[bi + 1:] *= 1.5
+
+        token_counts = np.bincount(text_ids, minlength=n)
+        sum_s = np.bincount(text_ids, weights=sentiments, minlength=n)
+        pos_sum = np.bincount(
+            text_ids, weights=np.where(sentiments > 0, sentiments + 1, 0.0), minlength=n
+        )
+        neg_sum = np.bincount(
+            text_ids, weights=np.where(sentiments < 0, sentiments - 1, 0.0), minlength=n
+        )
+        neu_count = np.bincount(
+            text_ids, weights=(sentiments == 0).astype(np.float64), minlength=n
+        )
+
+        ep_count = np.minimum(
+            np.asarray([text.count('!') for text in texts], dtype=np.float64), 4
+        )
+        qm_count = np.asarray([text.count('?') for text in texts], dtype=np.float64)
+        qm_amplifier = np.where(
+            qm_count > 1, np.where(qm_count <= 3, qm_count * 0.18, 0.96), 0.0
+        )
+        amplifier = ep_count * 0.292 + qm_amplifier
+
+        sum_s = sum_s + np.sign(sum_s) * amplifier
+        compound = sum_s / np.sqrt(sum_s * sum_s + 15)
+
+        abs_neg = np.abs(neg_sum)
+        pos_sum, neg_sum = (
+            np.where(pos_sum > abs_neg, pos_sum + amplifier, pos_sum),
+            np.where(pos_sum < abs_neg, neg_sum - amplifier, neg_sum),
+        )
+
+        total = pos_sum + np.abs(neg_sum) + neu_count
+        has_tokens = token_counts > 0
+        safe_total = np.where(has_tokens, total, 1.0)
+        pos = np.where(has_tokens, np.abs(pos_sum / safe_total), 0.0)
+        neg = np.where(has_tokens, np.abs(neg_sum / safe_total), 0.0)
+        neu = np.where(has_tokens, np.abs(neu_count / safe_total), 0.0)
+        compound = np.where(has_tokens, compound, 0.0)
+
+        return BatchScores(pos=pos, neg=neg, neu=neu, compound=compound)
+
+    @staticmethod
+    def to_polarity_dict(scores: BatchScores, i: int) -> Dict[str, float]:
+        """Round one batch entry the way ``polarity_scores`` does"""
+        return {
+            'neg': round(float(scores.neg[i]), 3),
+            'neu': round(float(scores.neu[i]), 3),
+            'pos': round(float(scores.pos[i]), 3),
+            'compound': round(float(scores.compound[i]), 4),
+        }